@@ -1,6 +1,6 @@
 """Core module for DOCX processing."""
 
-from .docx_processor import DocxProcessor
+from .docx_processor import DocxProcessor, FastDocxProcessor, ReplacementSet
 from .batch_processor import BatchProcessor
 
-__all__ = ['DocxProcessor', 'BatchProcessor']
+__all__ = ['DocxProcessor', 'FastDocxProcessor', 'ReplacementSet', 'BatchProcessor']
@@ -6,12 +6,29 @@ simultaneously with progress tracking and error handling.
 
 import os
 import threading
-from typing import List, Dict, Any, Optional, Callable, Tuple
+import multiprocessing
+from typing import List, Dict, Any, Optional, Callable, Tuple, Iterator
 from pathlib import Path
-from queue import Queue, Empty
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from queue import Queue, LifoQueue, SimpleQueue, Empty, Full
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
-from .docx_processor import DocxProcessor
+from utils.fastcopy import fast_copy
+
+from .docx_processor import DocxProcessor, FastDocxProcessor, ReplacementSet
+
+
+# Threads used to probe files during validation (blocking stat/zip reads)
+VALIDATION_WORKERS = 8
+
+# Threads issuing the backup copies of a batch
+BACKUP_WORKERS = 4
+
+# How long the collector waits for a result before checking worker health
+_RESULT_POLL_INTERVAL = 0.2
+
+# Results handed to a batch callback at once
+RESULT_BATCH_SIZE = 32
 
 
 class ProcessingResult:
@@ -33,6 +50,14 @@ class ProcessingResult:
         self.message = message
         self.replacements = replacements
         self.backup_path = backup_path
+        # Set when the file was rejected before anything was written to it,
+        # so a backup taken for it is not needed
+        self.file_untouched = False
+
+    @cached_property
+    def basename(self) -> str:
+        """File name of the processed file, computed once."""
+        return os.path.basename(self.file_path)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary.
@@ -49,23 +74,457 @@ class ProcessingResult:
         }
 
 
+def _prefetch_file(file_path: str) -> None:
+    """Ask the kernel to read a file into the page cache in the background.
+
+    Only a hint: it is skipped where ``posix_fadvise`` is not available
+    (Windows, macOS) and errors are ignored.
+
+    Args:
+        file_path: Path to the file
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class _ResultDispatcher:
+    """Delivers results to the batch callbacks in amortized groups.
+
+    Per-result callbacks still fire for every result. Batch callbacks get
+    groups of ``RESULT_BATCH_SIZE`` results, and progress is reported
+    every 1% of the files (at most every ``RESULT_BATCH_SIZE`` files), so
+    a GUI is not woken up once per file on big batches.
+    """
+
+    def __init__(
+        self,
+        total_files: int,
+        progress_callback: Optional[Callable[[int, int], None]],
+        result_callback: Optional[Callable[[ProcessingResult], None]],
+        result_batch_callback: Optional[Callable[[List[ProcessingResult]], None]]
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            total_files: Number of files whose results count towards progress
+            progress_callback: Optional callback for progress updates
+            result_callback: Optional callback for individual results
+            result_batch_callback: Optional callback for groups of results
+        """
+        self.total_files = total_files
+        self.processed_count = 0
+        self._progress_callback = progress_callback
+        self._result_callback = result_callback
+        self._result_batch_callback = result_batch_callback
+        self._progress_step = max(1, min(RESULT_BATCH_SIZE, total_files // 100))
+        self._pending: List[ProcessingResult] = []
+
+    def add(self, result: ProcessingResult, counts_progress: bool = True) -> None:
+        """Dispatch one result.
+
+        Args:
+            result: The processing result
+            counts_progress: Whether the result advances the progress count
+        """
+        if self._result_callback:
+            self._result_callback(result)
+
+        if self._result_batch_callback:
+            self._pending.append(result)
+            if len(self._pending) >= RESULT_BATCH_SIZE:
+                self.flush()
+
+        if counts_progress:
+            self.processed_count += 1
+            if self._progress_callback and (
+                self.processed_count % self._progress_step == 0
+                or self.processed_count == self.total_files
+            ):
+                self._progress_callback(self.processed_count, self.total_files)
+
+    def flush(self) -> None:
+        """Deliver the results still waiting for the batch callback."""
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self._result_batch_callback(pending)
+
+
+class _DocxProcessorPool:
+    """Pool of idle document processors, reused across files.
+
+    Each worker process keeps its own pool; processors are reset for the
+    next file instead of being rebuilt.
+    """
+
+    def __init__(self, max_idle: int = 4):
+        """Initialize the pool.
+
+        Args:
+            max_idle: Maximum number of idle processors kept per class
+        """
+        self._max_idle = max_idle
+        self._idle: Dict[type, LifoQueue] = {}
+        self._lock = threading.Lock()
+
+    def rent(self, processor_cls: type, file_path: str) -> DocxProcessor:
+        """Get a processor for a file, reusing an idle one when possible.
+
+        Args:
+            processor_cls: DocxProcessor or FastDocxProcessor
+            file_path: Path to the document
+
+        Returns:
+            Processor ready to load the file
+        """
+        try:
+            processor = self._queue_for(processor_cls).get_nowait()
+        except Empty:
+            return processor_cls(file_path)
+
+        processor.reset(file_path)
+        return processor
+
+    def return_(self, processor: DocxProcessor) -> None:
+        """Release a processor's document and put it back in the pool.
+
+        Args:
+            processor: Processor obtained from ``rent``
+        """
+        processor.close()
+        try:
+            self._queue_for(type(processor)).put_nowait(processor)
+        except Full:
+            pass
+
+    def _queue_for(self, processor_cls: type) -> LifoQueue:
+        with self._lock:
+            idle = self._idle.get(processor_cls)
+            if idle is None:
+                idle = self._idle[processor_cls] = LifoQueue(maxsize=self._max_idle)
+            return idle
+
+
+_PROCESSOR_POOL = _DocxProcessorPool()
+
+
+def _process_single_file_worker(
+    file_path: str,
+    replacements: ReplacementSet,
+    create_backup: bool,
+    backup_dir: Optional[str],
+    use_fast_path: bool = True
+) -> ProcessingResult:
+    """Process a single document.
+
+    Runs in a worker process, so it only takes picklable arguments and does
+    not touch any BatchProcessor state.
+
+    Args:
+        file_path: Path to the document
+        replacements: Compiled replacement rules
+        create_backup: Whether to create backup
+        backup_dir: Optional backup directory
+        use_fast_path: Whether to use FastDocxProcessor
+
+    Returns:
+        ProcessingResult object
+    """
+    processor_cls = FastDocxProcessor if use_fast_path else DocxProcessor
+    processor = _PROCESSOR_POOL.rent(processor_cls, file_path)
+    try:
+        # Load document
+        if not processor.load():
+            result = ProcessingResult(
+                file_path=file_path,
+                success=False,
+                message="Failed to load document"
+            )
+            result.file_untouched = True
+            return result
+
+        # Validate document
+        is_valid, errors = processor.validate_document()
+        if not is_valid:
+            result = ProcessingResult(
+                file_path=file_path,
+                success=False,
+                message=f"Invalid document: {', '.join(errors)}"
+            )
+            result.file_untouched = True
+            return result
+
+        # Create backup if requested
+        backup_path = ""
+        if create_backup:
+            backup_path = processor.create_backup(backup_dir)
+
+        # Perform replacements
+        total_replacements = processor.replace_multiple(replacements)
+
+        # Save document
+        if not processor.save():
+            return ProcessingResult(
+                file_path=file_path,
+                success=False,
+                message="Failed to save document",
+                backup_path=backup_path
+            )
+
+        return ProcessingResult(
+            file_path=file_path,
+            success=True,
+            message="Successfully processed",
+            replacements=total_replacements,
+            backup_path=backup_path
+        )
+
+    except Exception as e:
+        return ProcessingResult(
+            file_path=file_path,
+            success=False,
+            message=f"Error: {str(e)}"
+        )
+    finally:
+        _PROCESSOR_POOL.return_(processor)
+
+
+def _copy_backup(file_path: str, backup_path: str) -> Optional[str]:
+    """Copy a file to its reserved backup path.
+
+    Args:
+        file_path: Path of the file to back up
+        backup_path: Reserved backup path
+
+    Returns:
+        None on success, otherwise the error message
+    """
+    try:
+        fast_copy(file_path, backup_path)
+        return None
+    except OSError as e:
+        # Do not leave a reserved or partial backup behind
+        try:
+            os.remove(backup_path)
+        except OSError:
+            pass
+        return str(e)
+
+
+class _BackupFeeder:
+    """Feed files to the worker task queue as their backups complete.
+
+    The backup copies of a batch are all issued at once on a small thread
+    pool, so disk copies overlap with the processing of files that are
+    already backed up. Files are only queued once their backup exists, and
+    the worker sentinels follow the last one. Without backups every file is
+    queued immediately.
+    """
+
+    def __init__(self, task_queue, worker_count: int, backups: Dict[str, str]):
+        """Initialize the feeder.
+
+        Args:
+            task_queue: Queue the workers take file paths from
+            worker_count: Number of workers, one sentinel each
+            backups: Reserved backup path per file; entries of files whose
+                backup fails or is cancelled are removed
+        """
+        self._task_queue = task_queue
+        self._worker_count = worker_count
+        self._backups = backups
+        self._failures: SimpleQueue = SimpleQueue()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: list = []
+        self._lock = threading.Lock()
+        self._remaining = 0
+        self._closed = False
+
+    def start(self, file_paths: List[str]) -> None:
+        """Queue the files, backing them up first where required.
+
+        Args:
+            file_paths: Paths of the files to process
+        """
+        to_back_up = [file_path for file_path in file_paths if file_path in self._backups]
+        for file_path in file_paths:
+            if file_path not in self._backups:
+                self._task_queue.put(file_path)
+
+        self._remaining = len(to_back_up)
+        if not to_back_up:
+            self._send_sentinels()
+            return
+
+        self._executor = ThreadPoolExecutor(max_workers=min(BACKUP_WORKERS, len(to_back_up)))
+        self._futures = [
+            (file_path, self._executor.submit(self._back_up, file_path))
+            for file_path in to_back_up
+        ]
+
+    def _back_up(self, file_path: str) -> None:
+        """Copy one backup, then queue the file or record the failure."""
+        error = _copy_backup(file_path, self._backups[file_path])
+        if error is None:
+            self._task_queue.put(file_path)
+        else:
+            del self._backups[file_path]
+            self._failures.put((file_path, error))
+
+        with self._lock:
+            self._remaining -= 1
+            done = self._remaining == 0
+        if done:
+            self._send_sentinels()
+
+    def _send_sentinels(self) -> None:
+        """Queue one stop sentinel per worker, once."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for _ in range(self._worker_count):
+            self._task_queue.put(None)
+
+    def drain_failures(self) -> List[Tuple[str, str]]:
+        """Get the backups that failed since the last call.
+
+        Returns:
+            List of (file_path, error message) tuples
+        """
+        failures = []
+        while not self._failures.empty():
+            failures.append(self._failures.get())
+        return failures
+
+    def running(self) -> bool:
+        """Check whether backups are still being copied."""
+        return any(not future.done() for _, future in self._futures)
+
+    def close(self) -> None:
+        """Cancel outstanding backups and release the workers.
+
+        Reserved names of cancelled backups are removed again.
+        """
+        if self._executor is not None:
+            cancelled = [file_path for file_path, future in self._futures if future.cancel()]
+            self._executor.shutdown(wait=True)
+            for file_path in cancelled:
+                try:
+                    os.remove(self._backups.pop(file_path))
+                except OSError:
+                    pass
+        self._send_sentinels()
+
+
+def _worker_loop(
+    task_queue,
+    result_queue,
+    stop_event,
+    replacements: ReplacementSet,
+    create_backup: bool,
+    backup_dir: Optional[str],
+    use_fast_path: bool
+) -> None:
+    """Drain file paths from the task queue until a ``None`` sentinel.
+
+    Args:
+        task_queue: Queue of file paths to process
+        result_queue: Queue receiving one ProcessingResult per processed
+            file, or the bare path of a file skipped after a stop request
+        stop_event: Event set when the batch is cancelled
+        replacements: Compiled replacement rules
+        create_backup: Whether to create backups
+        backup_dir: Optional backup directory
+        use_fast_path: Whether to use FastDocxProcessor
+    """
+    while True:
+        file_path = task_queue.get()
+        if file_path is None:
+            break
+        if stop_event.is_set():
+            # Keep draining so the sentinel is reached quickly; the file is
+            # reported as untouched so its backup can be removed
+            result_queue.put(file_path)
+            continue
+        result_queue.put(_process_single_file_worker(
+            file_path, replacements, create_backup, backup_dir, use_fast_path
+        ))
+
+
+def _iter_docx_files(directory: str, recursive: bool) -> Iterator[str]:
+    """Yield the DOCX files of a directory using ``os.scandir``.
+
+    Directory entries carry their file type, so no extra ``stat`` call is
+    needed per entry. Subdirectories are walked from an explicit stack
+    rather than by recursion, so deep trees neither hit the recursion limit
+    nor pass every path up a chain of nested generators. Like ``os.walk``,
+    symlinked directories are not descended into and unreadable
+    subdirectories are skipped.
+
+    Args:
+        directory: Path to the directory
+        recursive: Whether to descend into subdirectories
+
+    Yields:
+        Paths of DOCX files
+
+    Raises:
+        OSError: If the directory itself cannot be read
+    """
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if recursive and not entry.is_symlink():
+                            pending.append(entry.path)
+                    elif entry.name.lower().endswith('.docx'):
+                        yield entry.path
+        except OSError:
+            if current is directory:
+                raise
+
+
 class BatchProcessor:
-    """Process multiple DOCX documents with threading support.
+    """Process multiple DOCX documents in parallel worker processes.
 
     This class manages batch processing of multiple DOCX documents,
     providing progress tracking, error handling, and result aggregation.
     """
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: Optional[int] = None, use_fast_path: bool = True):
         """Initialize batch processor.
 
+        Document processing is CPU-bound (XML parsing and text scanning), so
+        it runs in a process pool to use all cores instead of serializing on
+        the GIL.
+
         Args:
-            max_workers: Maximum number of worker threads
+            max_workers: Maximum number of worker processes. Defaults to
+                the number of CPUs.
+            use_fast_path: Process documents with FastDocxProcessor, which
+                edits only the text XML parts of the package instead of
+                loading the full python-docx object model
         """
-        self.max_workers = max_workers
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_fast_path = use_fast_path
         self.results: List[ProcessingResult] = []
         self._stop_event = threading.Event()
         self._progress_queue: Queue = Queue()
+        # Stop flag shared with the worker processes of the running batch
+        self._worker_stop_event = None
 
     def process_documents(
         self,
@@ -74,7 +533,8 @@ class BatchProcessor:
         create_backup: bool = True,
         backup_dir: Optional[str] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
-        result_callback: Optional[Callable[[ProcessingResult], None]] = None
+        result_callback: Optional[Callable[[ProcessingResult], None]] = None,
+        result_batch_callback: Optional[Callable[[List[ProcessingResult]], None]] = None
     ) -> List[ProcessingResult]:
         """Process multiple documents with text replacements.
 
@@ -83,8 +543,11 @@ class BatchProcessor:
             replacements: List of (search_text, replace_text) tuples
             create_backup: Whether to create backup files
             backup_dir: Optional directory for backups
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback for progress updates,
+                throttled on big batches
             result_callback: Optional callback for individual document results
+            result_batch_callback: Optional callback receiving results in
+                groups of up to ``RESULT_BATCH_SIZE``
 
         Returns:
             List of ProcessingResult objects
@@ -92,184 +555,296 @@ class BatchProcessor:
         self.results = []
         self._stop_event.clear()
 
+        # Compile the rules once and share them across all documents
+        rules = ReplacementSet.coerce(replacements)
+
         # Validate all files first
         valid_files = self._validate_files(file_paths)
         invalid_files = set(file_paths) - set(valid_files)
+        dispatcher = _ResultDispatcher(
+            len(valid_files), progress_callback, result_callback, result_batch_callback
+        )
 
-        # Report invalid files
-        for file_path in invalid_files:
-            result = ProcessingResult(
-                file_path=file_path,
-                success=False,
-                message="Invalid or unreadable DOCX file"
-            )
-            self.results.append(result)
-            if result_callback:
-                result_callback(result)
+        try:
+            # Report invalid files
+            for file_path in invalid_files:
+                result = ProcessingResult(
+                    file_path=file_path,
+                    success=False,
+                    message="Invalid or unreadable DOCX file"
+                )
+                self.results.append(result)
+                dispatcher.add(result, counts_progress=False)
+
+            # Reserve every backup name before any file is modified; the
+            # copies themselves run while earlier files are processed
+            backups: Dict[str, str] = {}
+            if create_backup and valid_files:
+                backups, backup_errors = self._reserve_backups(valid_files, backup_dir)
+                for file_path in valid_files:
+                    if file_path not in backup_errors:
+                        continue
+                    result = ProcessingResult(
+                        file_path=file_path,
+                        success=False,
+                        message=f"Backup failed: {backup_errors[file_path]}"
+                    )
+                    self.results.append(result)
+                    dispatcher.add(result)
+                valid_files = [file_path for file_path in valid_files if file_path in backups]
 
-        total_files = len(valid_files)
-        processed_count = 0
-
-        # Process valid files
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(
-                    self._process_single_file,
-                    file_path,
-                    replacements,
-                    create_backup,
-                    backup_dir
-                ): file_path
-                for file_path in valid_files
-            }
-
-            # Process results as they complete
-            for future in as_completed(future_to_file):
-                if self._stop_event.is_set():
-                    break
+            # Process valid files
+            if valid_files:
+                self._run_workers(valid_files, rules, backups, dispatcher)
+        finally:
+            dispatcher.flush()
 
-                file_path = future_to_file[future]
-                try:
-                    result = future.result()
-                    self.results.append(result)
+        return self.results
 
-                    processed_count += 1
+    def _run_workers(
+        self,
+        valid_files: List[str],
+        rules: ReplacementSet,
+        backups: Dict[str, str],
+        dispatcher: _ResultDispatcher
+    ) -> None:
+        """Process the validated files on worker processes.
 
-                    if result_callback:
-                        result_callback(result)
+        Args:
+            valid_files: Paths of the files to process
+            rules: Compiled replacement rules
+            backups: Backup path of each file, for files that were backed up
+            dispatcher: Receives each result as it arrives
+        """
+        total_files = len(valid_files)
 
-                    if progress_callback:
-                        progress_callback(processed_count, total_files)
+        # A fixed set of worker processes drains one shared task queue, so
+        # bookkeeping is O(workers) rather than one future per file.
+        # Always spawn: forking a process that already runs Qt and executor
+        # threads is unsafe, and spawn is what Windows builds use anyway
+        context = multiprocessing.get_context('spawn')
+        task_queue = context.Queue()
+        result_queue = context.Queue()
+        self._worker_stop_event = context.Event()
+        if self._stop_event.is_set():
+            self._worker_stop_event.set()
+
+        worker_count = min(self.max_workers, total_files)
+        feeder = _BackupFeeder(task_queue, worker_count, backups)
+
+        workers = [
+            context.Process(
+                target=_worker_loop,
+                args=(
+                    task_queue,
+                    result_queue,
+                    self._worker_stop_event,
+                    rules,
+                    False,
+                    None,
+                    self.use_fast_path
+                ),
+                daemon=True
+            )
+            for _ in range(worker_count)
+        ]
+        for worker in workers:
+            worker.start()
 
-                except Exception as e:
+        pending_files = set(valid_files)
+        try:
+            # Files are queued for the workers as soon as they are backed up
+            feeder.start(valid_files)
+
+            while pending_files and not self._stop_event.is_set():
+                for file_path, error in feeder.drain_failures():
+                    pending_files.discard(file_path)
+                    result = ProcessingResult(
+                        file_path=file_path,
+                        success=False,
+                        message=f"Backup failed: {error}"
+                    )
+                    self.results.append(result)
+                    dispatcher.add(result)
+                if not pending_files:
+                    break
+
+                try:
+                    result = result_queue.get(timeout=_RESULT_POLL_INTERVAL)
+                except Empty:
+                    if not feeder.running() and not any(worker.is_alive() for worker in workers):
+                        break
+                    continue
+
+                if isinstance(result, str):
+                    # Skipped after a stop request
+                    self._discard_backup(backups, result)
+                    continue
+
+                pending_files.discard(result.file_path)
+                if result.file_untouched:
+                    self._discard_backup(backups, result.file_path)
+                result.backup_path = backups.get(result.file_path, "")
+                self.results.append(result)
+                dispatcher.add(result)
+
+            if pending_files and not self._stop_event.is_set():
+                # Workers exited without reporting these files
+                for file_path in valid_files:
+                    if file_path not in pending_files:
+                        continue
                     error_result = ProcessingResult(
                         file_path=file_path,
                         success=False,
-                        message=f"Processing error: {str(e)}"
+                        message="Processing error: worker process exited unexpectedly",
+                        backup_path=backups.get(file_path, "")
                     )
                     self.results.append(error_result)
+                    dispatcher.add(error_result)
+        finally:
+            feeder.close()
+            self._shutdown_workers(workers, result_queue, backups)
 
-                    if result_callback:
-                        result_callback(error_result)
+    @classmethod
+    def _discard_untouched_backup(cls, backups: Dict[str, str], report: Any) -> None:
+        """Remove the backup of a late worker report if it is not needed.
 
-                    processed_count += 1
+        Args:
+            backups: Backup path of each file, for files that were backed up
+            report: A ProcessingResult, or the path of a skipped file
+        """
+        if isinstance(report, str):
+            cls._discard_backup(backups, report)
+        elif report.file_untouched:
+            cls._discard_backup(backups, report.file_path)
 
-                    if progress_callback:
-                        progress_callback(processed_count, total_files)
+    @staticmethod
+    def _discard_backup(backups: Dict[str, str], file_path: str) -> None:
+        """Remove the backup of a file that was left unchanged.
 
-        return self.results
+        Args:
+            backups: Backup path of each file, for files that were backed up
+            file_path: Path of the unchanged file
+        """
+        backup_path = backups.pop(file_path, None)
+        if backup_path:
+            try:
+                os.remove(backup_path)
+            except OSError:
+                pass
 
-    def _process_single_file(
-        self,
-        file_path: str,
-        replacements: List[Tuple[str, str]],
-        create_backup: bool,
+    @staticmethod
+    def _reserve_backups(
+        file_paths: List[str],
         backup_dir: Optional[str]
-    ) -> ProcessingResult:
-        """Process a single document.
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Reserve the backup names of all files of a batch.
+
+        Names are reserved in input order, so same-named files are numbered
+        deterministically however the copies are scheduled later.
 
         Args:
-            file_path: Path to the document
-            replacements: List of (search_text, replace_text) tuples
-            create_backup: Whether to create backup
-            backup_dir: Optional backup directory
+            file_paths: Paths of the files to back up
+            backup_dir: Optional directory for backups
 
         Returns:
-            ProcessingResult object
+            Tuple of (backup path per file, error message per failed file)
         """
-        try:
-            # Check for stop event
-            if self._stop_event.is_set():
-                return ProcessingResult(
-                    file_path=file_path,
-                    success=False,
-                    message="Processing cancelled"
-                )
+        backups: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+        for file_path in file_paths:
+            try:
+                backups[file_path] = DocxProcessor.prepare_backup_path(file_path, backup_dir)
+            except OSError as e:
+                errors[file_path] = str(e)
+        return backups, errors
 
-            processor = DocxProcessor(file_path)
+    def _validate_files(self, file_paths: List[str]) -> List[str]:
+        """Validate that all files are valid DOCX files.
 
-            # Load document
-            if not processor.load():
-                return ProcessingResult(
-                    file_path=file_path,
-                    success=False,
-                    message="Failed to load document"
-                )
+        The checks are blocking file-system probes, so they run concurrently
+        on a small thread pool to keep many files in flight.
 
-            # Validate document
-            is_valid, errors = processor.validate_document()
-            if not is_valid:
-                return ProcessingResult(
-                    file_path=file_path,
-                    success=False,
-                    message=f"Invalid document: {', '.join(errors)}"
-                )
+        Args:
+            file_paths: List of file paths to validate
 
-            # Create backup if requested
-            backup_path = ""
-            if create_backup:
-                backup_path = processor.create_backup(backup_dir)
+        Returns:
+            List of valid file paths, in input order
+        """
+        if not file_paths:
+            return []
 
-            # Perform replacements
-            total_replacements = 0
-            for search_text, replace_text in replacements:
-                count = processor.replace_text(search_text, replace_text)
-                total_replacements += count
+        workers = min(VALIDATION_WORKERS, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            checks = list(executor.map(self._is_valid_file, file_paths))
 
-            # Save document
-            if not processor.save():
-                return ProcessingResult(
-                    file_path=file_path,
-                    success=False,
-                    message="Failed to save document",
-                    backup_path=backup_path
-                )
+        return [file_path for file_path, valid in zip(file_paths, checks) if valid]
 
-            return ProcessingResult(
-                file_path=file_path,
-                success=True,
-                message="Successfully processed",
-                replacements=total_replacements,
-                backup_path=backup_path
-            )
-
-        except Exception as e:
-            return ProcessingResult(
-                file_path=file_path,
-                success=False,
-                message=f"Error: {str(e)}"
-            )
-
-    def _validate_files(self, file_paths: List[str]) -> List[str]:
-        """Validate that all files are valid DOCX files.
+    @staticmethod
+    def _is_valid_file(file_path: str) -> bool:
+        """Check that a single file exists, is readable and is a DOCX file.
 
         Args:
-            file_paths: List of file paths to validate
+            file_path: Path to the file
 
         Returns:
-            List of valid file paths
+            True if the file can be processed
         """
-        valid_files = []
+        # Check if file exists
+        if not os.path.exists(file_path):
+            return False
 
-        for file_path in file_paths:
-            # Check if file exists
-            if not os.path.exists(file_path):
-                continue
+        # Check if file is readable
+        if not os.access(file_path, os.R_OK):
+            return False
+
+        # Check if it's a DOCX file
+        if not DocxProcessor.is_docx_file(file_path):
+            return False
+
+        # Start reading it into the page cache before a worker opens it
+        _prefetch_file(file_path)
+        return True
 
-            # Check if file is readable
-            if not os.access(file_path, os.R_OK):
-                continue
+    def _shutdown_workers(self, workers: list, result_queue, backups: Dict[str, str]) -> None:
+        """Wait for the worker processes to exit.
 
-            # Check if it's a DOCX file
-            if DocxProcessor.is_docx_file(file_path):
-                valid_files.append(file_path)
+        Results still in flight (e.g. after a stop request) are drained so
+        that no worker blocks on a full result pipe while exiting. Backups
+        of files reported as skipped or untouched are removed.
 
-        return valid_files
+        Args:
+            workers: Worker processes of the batch
+            result_queue: Queue the workers report results to
+            backups: Backup path of each file, for files that were backed up
+        """
+        if self._stop_event.is_set():
+            self._worker_stop_event.set()
+
+        while any(worker.is_alive() for worker in workers):
+            try:
+                self._discard_untouched_backup(
+                    backups, result_queue.get(timeout=_RESULT_POLL_INTERVAL)
+                )
+            except Empty:
+                pass
+        # Reports flushed just before the last worker exited
+        while True:
+            try:
+                self._discard_untouched_backup(backups, result_queue.get_nowait())
+            except Empty:
+                break
+
+        for worker in workers:
+            worker.join()
+        self._worker_stop_event = None
 
     def stop(self) -> None:
         """Stop all processing."""
         self._stop_event.set()
+        worker_stop_event = self._worker_stop_event
+        if worker_stop_event is not None:
+            worker_stop_event.set()
 
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of batch processing results.
@@ -317,19 +892,13 @@ class BatchProcessor:
         Returns:
             List of DOCX file paths
         """
-        docx_files = []
-
-        if recursive:
-            for root, _, files in os.walk(directory):
-                for file in files:
-                    if file.lower().endswith('.docx'):
-                        docx_files.append(os.path.join(root, file))
-        else:
-            for file in os.listdir(directory):
-                if file.lower().endswith('.docx'):
-                    docx_files.append(os.path.join(directory, file))
-
-        return sorted(docx_files)
+        try:
+            return sorted(_iter_docx_files(directory, recursive))
+        except OSError:
+            if not recursive:
+                raise
+            # As with os.walk, an unreadable top-level directory yields nothing
+            return []
 
     def clear_results(self) -> None:
         """Clear all processing results."""
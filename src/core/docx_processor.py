@@ -6,17 +6,625 @@ preservation.
 """
 
 import os
+import re
+import html
 import shutil
-from typing import List, Dict, Any, Optional, Tuple, Callable
+import struct
+import zipfile
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from functools import lru_cache
+from itertools import accumulate, count as iter_count
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable, Iterator, Union, Pattern, Set, Sequence, BinaryIO
 from pathlib import Path
 from docx import Document
+from docx.blkcntnr import BlockItemContainer
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from docx.opc.oxml import serialize_part_xml
 from docx.text.paragraph import Paragraph
 from docx.table import Table, _Cell
 from docx.oxml.text.paragraph import CT_P
 
+from utils.fastcopy import fast_copy
 from utils.format_preserver import FormatPreserver
 
 
+DOCUMENT_PART = 'word/document.xml'
+
+# Header and footer parts carry their own paragraphs and tables
+_HEADER_FOOTER_PART = re.compile(r'^word/(?:header|footer)\d*\.xml$')
+
+# Members every DOCX package must contain
+_REQUIRED_DOCX_PARTS = ('[Content_Types].xml', '_rels/.rels', DOCUMENT_PART)
+
+# Local file header signature every (non-empty) ZIP archive starts with
+_ZIP_MAGIC = b'PK\x03\x04'
+
+# End of central directory record: fixed part and the largest possible
+# trailing archive comment
+_EOCD = struct.Struct('<4s4H2LH')
+_EOCD_SIGNATURE = b'PK\x05\x06'
+_EOCD_SEARCH_SIZE = _EOCD.size + 0xFFFF
+
+# Central directory file header, fixed part
+_CD_ENTRY = struct.Struct('<4s6H3L5H2L')
+_CD_ENTRY_SIGNATURE = b'PK\x01\x02'
+
+# Next numbered suffix to try per unnumbered backup path, so backing up many
+# same-named files does not re-probe every earlier name each time
+_BACKUP_COUNTER_HINTS: Dict[str, int] = {}
+_BACKUP_COUNTER_HINT_LIMIT = 4096
+
+# Suffix counter for temporary save files; together with the process id
+# it names them uniquely without drawing random bytes
+_TEMP_NAME_COUNTER = iter_count()
+
+# Raw XML prescreen: the text python-docx sees in a paragraph is the
+# ``w:t``/``w:tab``/``w:br``/``w:cr`` content of the runs that are direct
+# children of the paragraph. These elements can hold runs or paragraphs
+# that python-docx skips, whose text would then interleave with the
+# visible text, so parts containing them are never prescreened.
+_W_NAMESPACE_DECL = b'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+_NESTED_RUN_CONTAINER = re.compile(
+    rb'<(?:w:(?:hyperlink|fldSimple|smartTag|customXml|sdt|ins|del|moveFrom|moveTo'
+    rb'|dir|bdo|ruby|txbxContent)|m:oMath|mc:AlternateContent)[\s/>]|<!--|<!\[CDATA\['
+)
+_RAW_TAB = re.compile(rb'<w:tab(?:\s[^>]*)?/?>')
+_RAW_BREAK = re.compile(rb'<w:(?:br|cr)(?:\s[^>]*)?/?>')
+_RAW_TEXT = re.compile(rb'<w:t(?:\s[^>]*)?>([^<]*)</w:t>')
+
+
+def _raw_part_text(blob: bytes) -> Optional[str]:
+    """Extract the run text of an XML part without parsing it.
+
+    Paragraph texts come out in document order and concatenated, so any
+    text found in a paragraph is also found in the result.
+
+    Args:
+        blob: Raw XML of a document, header or footer part
+
+    Returns:
+        The concatenated run text, or None if the part uses markup the
+        byte-level scan cannot account for
+    """
+    if _W_NAMESPACE_DECL not in blob or _NESTED_RUN_CONTAINER.search(blob):
+        return None
+
+    blob = _RAW_TAB.sub(b'<w:t>\t</w:t>', blob)
+    blob = _RAW_BREAK.sub(b'<w:t>\n</w:t>', blob)
+    try:
+        text = b''.join(_RAW_TEXT.findall(blob)).decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    return html.unescape(text) if '&' in text else text
+
+
+# The table walk resolves vertically merged continuation cells to the cell
+# above and so skips their own content, which a flat scan cannot mimic
+_MERGED_CELL = re.compile(rb'<w:vMerge[\s/>]')
+_RAW_TEXT_NODE = re.compile(rb'(<w:t(?:\s[^>]*)?>)([^<]*)(</w:t>)')
+# Characters that need escaping in XML or that python-docx maps to elements
+_RAW_UNSAFE_CHARS = re.compile('[<>&\t\n\r\x00]')
+
+
+def _replace_in_raw_xml(blob: bytes, rules: 'ReplacementSet') -> Optional[Tuple[bytes, int]]:
+    """Apply replacements to an XML part by editing its text nodes as bytes.
+
+    Only used when the outcome is provably the same as the paragraph-level
+    replacement: every match lies inside a single ``w:t`` node, no entity
+    or markup character is involved and no node gains leading or trailing
+    whitespace that would need ``xml:space``. Run formatting is untouched
+    either way since no match spans runs.
+
+    Args:
+        blob: Raw XML of a document, header or footer part
+        rules: Compiled replacement rules
+
+    Returns:
+        Tuple of (new_blob, replacement_count), or None if the part has to
+        be parsed instead
+    """
+    raw_text = _raw_part_text(blob)
+    if raw_text is None:
+        return None
+    rules = rules.restricted_to(raw_text)
+    if not rules:
+        return blob, 0
+
+    for search_text, replace_text in rules:
+        if (_RAW_UNSAFE_CHARS.search(search_text) or _RAW_UNSAFE_CHARS.search(replace_text)
+                or not replace_text or replace_text != replace_text.strip()):
+            return None
+    if _MERGED_CELL.search(blob):
+        return None
+
+    # re.split keeps the three groups: [before, open, text, close, between, ...]
+    pieces = _RAW_TEXT_NODE.split(blob)
+    text = b'\x00'.join(pieces[2::4])
+    if b'&' in text:
+        return None
+
+    count = 0
+    for search_text, replace_text in rules:
+        needle = search_text.encode('utf-8')
+        occurrences = re.compile(b'(?=' + re.escape(needle) + b')')
+        hits = len(occurrences.findall(text))
+        if hits != len(occurrences.findall(text.replace(b'\x00', b''))):
+            # A match spans text nodes
+            return None
+        if hits:
+            count += text.count(needle)
+            text = text.replace(needle, replace_text.encode('utf-8'))
+
+    if not count:
+        return blob, 0
+    pieces[2::4] = text.split(b'\x00')
+    return b''.join(pieces), count
+
+
+def _create_temp_file(path: str) -> Tuple[str, BinaryIO]:
+    """Create a new temporary file next to a path.
+
+    Args:
+        path: Path the temporary file will later replace
+
+    Returns:
+        Tuple of the temporary file path and the file, opened for writing
+
+    Raises:
+        OSError: If the file cannot be created
+    """
+    while True:
+        tmp_path = f"{path}.{os.getpid()}-{next(_TEMP_NAME_COUNTER)}.tmp"
+        try:
+            return tmp_path, open(tmp_path, 'xb')
+        except FileExistsError:
+            continue
+
+
+def _central_directory_names(handle: Any) -> Optional[Set[str]]:
+    """Read the member names of a ZIP archive from its central directory.
+
+    Only the end of central directory record and the fixed-size entry
+    headers are decoded, without building a ``ZipInfo`` per member.
+
+    Args:
+        handle: Binary file object positioned anywhere
+
+    Returns:
+        Set of member names, an empty set if the file has no end of
+        central directory record, or None if the archive needs a full
+        ``ZipFile`` parse (ZIP64, inconsistent headers, non-portable names)
+    """
+    size = handle.seek(0, os.SEEK_END)
+    tail_size = min(size, _EOCD_SEARCH_SIZE)
+    handle.seek(size - tail_size)
+    tail = handle.read(tail_size)
+
+    eocd_pos = tail.rfind(_EOCD_SIGNATURE)
+    if eocd_pos < 0 or len(tail) - eocd_pos < _EOCD.size:
+        return set()
+    (_, disk, cd_disk, disk_entries, entries,
+     cd_size, cd_offset, _) = _EOCD.unpack_from(tail, eocd_pos)
+    if (disk or cd_disk or disk_entries != entries or entries == 0xFFFF
+            or cd_size == 0xFFFFFFFF or cd_offset == 0xFFFFFFFF):
+        return None
+
+    # Locate the directory relative to the record, which also covers
+    # archives with data prepended to them
+    cd_start = size - tail_size + eocd_pos - cd_size
+    if cd_start < 0:
+        return None
+    if cd_start >= size - tail_size:
+        directory = tail[cd_start - (size - tail_size):eocd_pos]
+    else:
+        handle.seek(cd_start)
+        directory = handle.read(cd_size)
+
+    names = set()
+    pos = 0
+    for _ in range(entries):
+        if len(directory) - pos < _CD_ENTRY.size:
+            return None
+        header = _CD_ENTRY.unpack_from(directory, pos)
+        if header[0] != _CD_ENTRY_SIGNATURE:
+            return None
+        name_len, extra_len, comment_len = header[10], header[11], header[12]
+        name = directory[pos + _CD_ENTRY.size:pos + _CD_ENTRY.size + name_len]
+        if name_len != len(name) or b'\\' in name or max(name, default=0) >= 0x80:
+            # Leave decoding and separator handling to ZipFile
+            return None
+        names.add(name.decode('ascii'))
+        pos += _CD_ENTRY.size + name_len + extra_len + comment_len
+    return names
+
+
+@lru_cache(maxsize=8192)
+def _docx_validity_cache(file_path: str, mtime_ns: int, size: int) -> bool:
+    """Check the ZIP structure of a DOCX file.
+
+    Cached by path and stat signature, so re-validating an unchanged file
+    costs a single ``os.stat``; any modification invalidates the entry.
+
+    Args:
+        file_path: Path to the file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        True if the file is a ZIP archive with the required DOCX parts
+
+    Raises:
+        OSError: If the file cannot be read; such failures may be transient
+            (permissions, sharing violations, network shares) and are
+            therefore not cached
+    """
+    try:
+        # Reject non-ZIP files before paying for the central directory parse,
+        # and decide from the raw central directory where possible
+        with open(file_path, 'rb') as handle:
+            if handle.read(4) != _ZIP_MAGIC:
+                return False
+            names = _central_directory_names(handle)
+        if names is not None:
+            return all(name in names for name in _REQUIRED_DOCX_PARTS)
+
+        with zipfile.ZipFile(file_path, 'r') as zip_ref:
+            # Check for required DOCX files; getinfo looks names up in the
+            # parsed central directory instead of listing every entry, and
+            # raises KeyError for a missing one
+            for req_file in _REQUIRED_DOCX_PARTS:
+                zip_ref.getinfo(req_file)
+        return True
+    except OSError:
+        raise
+    except Exception:
+        return False
+
+
+def _paragraph_text(paragraph_element: CT_P) -> str:
+    """Get the text of a paragraph element.
+
+    Same text as ``Paragraph.text``, without wrapping every run.
+
+    Args:
+        paragraph_element: The ``w:p`` element of the paragraph
+
+    Returns:
+        Text of the runs that are direct children of the paragraph
+    """
+    return ''.join(r.text for r in paragraph_element.r_lst)
+
+
+def _run_ends(run_texts: List[str]) -> Sequence[int]:
+    """Compute the cumulative end offset of each run in the paragraph text.
+
+    The offsets are kept in a C ``long`` array rather than a list of int
+    objects, which is compact and contiguous for ``bisect``.
+
+    Args:
+        run_texts: Text of each run
+
+    Returns:
+        End offset of each run
+    """
+    return array('l', accumulate(map(len, run_texts)))
+
+
+def _run_span(
+    run_texts: List[str],
+    run_ends: Sequence[int],
+    start: int,
+    end: int
+) -> Tuple[int, int, int, int]:
+    """Map a match in the paragraph text to the runs it covers.
+
+    Args:
+        run_texts: Text of each run
+        run_ends: Cumulative end offset of each run in the paragraph text
+        start: Match start in the paragraph text
+        end: Match end in the paragraph text
+
+    Returns:
+        (start_run_idx, start_offset, end_run_idx, end_offset), with the
+        offsets relative to their run
+    """
+    # First run ending after the match start, and first run reaching the
+    # match end (empty runs are never chosen as start run)
+    start_run_idx = bisect_right(run_ends, start)
+    end_run_idx = bisect_left(run_ends, end)
+    return (
+        start_run_idx,
+        start - (run_ends[start_run_idx] - len(run_texts[start_run_idx])),
+        end_run_idx,
+        end - (run_ends[end_run_idx] - len(run_texts[end_run_idx]))
+    )
+
+
+def _find_spans(
+    text: str,
+    run_texts: List[str],
+    run_ends: Sequence[int],
+    search_text: str,
+    match_index: int
+) -> List[Tuple[int, int, int, int]]:
+    """Find all matches of a search text and map them to runs.
+
+    Matches are collected on the original text. Replacing resumes after
+    each match and the text there is unchanged by earlier replacements, so
+    this finds exactly the matches that replacing one at a time would.
+
+    Args:
+        text: Paragraph text, the concatenation of ``run_texts``
+        run_texts: Text of each run
+        run_ends: Cumulative end offset of each run in ``text``
+        search_text: Non-empty text to search for
+        match_index: Position of the first match, as found by the caller
+
+    Returns:
+        List of (start_run_idx, start_offset, end_run_idx, end_offset)
+        tuples in text order
+    """
+    spans = []
+    search_len = len(search_text)
+    while match_index != -1:
+        end_pos = match_index + search_len
+        spans.append(_run_span(run_texts, run_ends, match_index, end_pos))
+        match_index = text.find(search_text, end_pos)
+    return spans
+
+
+def _find_pattern_spans(
+    text: str,
+    run_texts: List[str],
+    run_ends: Sequence[int],
+    pattern: Pattern
+) -> Tuple[List[Tuple[int, int, int, int]], List[str]]:
+    """Find all matches of an alternation pattern and map them to runs.
+
+    Args:
+        text: Paragraph text, the concatenation of ``run_texts``
+        run_texts: Text of each run
+        run_ends: Cumulative end offset of each run in ``text``
+        pattern: Compiled pattern of the search texts
+
+    Returns:
+        Tuple of the spans, as returned by ``_find_spans``, and the matched
+        text of each span
+    """
+    spans = []
+    matched = []
+    for match in pattern.finditer(text):
+        spans.append(_run_span(run_texts, run_ends, match.start(), match.end()))
+        matched.append(match.group())
+    return spans, matched
+
+
+_W_T = qn('w:t')
+_XML_SPACE = qn('xml:space')
+_RUN_CONTROL_CHARS = re.compile('[\t\r\n]')
+
+
+def _set_run_text(run: Any, text: str) -> None:
+    """Set the text of a run, producing the XML of the ``Run.text`` setter.
+
+    The setter translates the text character by character into ``w:t``,
+    ``w:tab`` and ``w:br`` elements. Text without tabs or line breaks maps
+    to at most one ``w:t``, which is written here directly on the lxml
+    element, reusing the run's text node when it is the only content.
+
+    Args:
+        run: A python-docx Run object
+        text: New text of the run
+    """
+    if _RUN_CONTROL_CHARS.search(text):
+        run.text = text
+        return
+
+    r = run._r
+    content = r[1:] if r.rPr is not None else r[:]
+    if text and len(content) == 1 and content[0].tag == _W_T:
+        t = content[0]
+        t.text = text
+        if len(text.strip()) < len(text):
+            t.set(_XML_SPACE, 'preserve')
+        elif _XML_SPACE in t.attrib:
+            del t.attrib[_XML_SPACE]
+        return
+
+    for child in content:
+        r.remove(child)
+    if text:
+        r.add_t(text)
+
+
+def _search_texts_overlap(first: str, second: str) -> bool:
+    """Check whether two search texts can match overlapping text.
+
+    Args:
+        first: A search text
+        second: Another search text
+
+    Returns:
+        True if one contains the other or a suffix of one is a prefix of
+        the other
+    """
+    if first in second or second in first:
+        return True
+    for size in range(1, min(len(first), len(second))):
+        if first.endswith(second[:size]) or second.endswith(first[:size]):
+            return True
+    return False
+
+
+class ReplacementSet:
+    """An ordered list of replacement rules compiled for fast matching.
+
+    Rules are applied one after another, exactly as if ``replace_text`` were
+    called once per rule. All search texts are additionally compiled into a
+    single alternation pattern so that text matching none of the rules is
+    rejected with one scan instead of one scan per rule. Consecutive rules
+    that cannot interact are grouped into stages, and each stage is applied
+    in a single scan. Build it once per batch and share it across documents.
+    """
+
+    def __init__(self, replacements: Iterable[Tuple[str, str]]):
+        """Compile the replacement rules.
+
+        Args:
+            replacements: List of (search_text, replace_text) tuples. Rules
+                with an empty search text are ignored.
+        """
+        self.rules: Tuple[Tuple[str, str], ...] = tuple(
+            (search_text, replace_text)
+            for search_text, replace_text in replacements
+            if search_text
+        )
+
+        needles = sorted({search_text for search_text, _ in self.rules}, key=len, reverse=True)
+        self._single_needle: Optional[str] = needles[0] if len(needles) == 1 else None
+        self._pattern = re.compile('|'.join(map(re.escape, needles))) if needles else None
+
+        # Groups of consecutive rules, each applied in a single scan
+        self._stages: Tuple[Tuple[Optional[Pattern], Dict[str, str]], ...] = self._build_stages()
+
+    def _build_stages(self) -> Tuple[Tuple[Optional[Pattern], Dict[str, str]], ...]:
+        """Group consecutive rules that can be applied in one scan.
+
+        One scan of a stage equals applying its rules one after another
+        when no rule writes characters a later rule of the stage searches
+        for, no two search texts can match overlapping text, and only the
+        last rule of the stage deletes text. Each rule then replaces exactly
+        its own matches in the text the stage starts from.
+
+        Returns:
+            Tuple of (pattern, mapping) stages in rule order; ``mapping``
+            maps each search text to its replacement and ``pattern`` matches
+            them all, or is None for a stage with a single search text
+        """
+        stages = []
+        mapping: Dict[str, str] = {}
+        written_chars: set = set()
+        deletes = False
+        for search_text, replace_text in self.rules:
+            independent = not deletes and written_chars.isdisjoint(search_text)
+            if independent and search_text in mapping:
+                # Every match is already replaced by the earlier rule and
+                # cannot be recreated within the stage
+                continue
+            if mapping and (
+                not independent
+                or any(_search_texts_overlap(search_text, other) for other in mapping)
+            ):
+                stages.append(mapping)
+                mapping = {}
+                written_chars = set()
+            mapping[search_text] = replace_text
+            written_chars.update(replace_text)
+            deletes = not replace_text
+        if mapping:
+            stages.append(mapping)
+
+        if len(stages) == 1 and len(stages[0]) > 1:
+            return ((self._pattern, stages[0]),)
+        return tuple(
+            (
+                re.compile('|'.join(map(re.escape, stage))) if len(stage) > 1 else None,
+                stage
+            )
+            for stage in stages
+        )
+
+    def matches(self, text: str) -> bool:
+        """Check whether any rule's search text occurs in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            True if at least one rule may apply
+        """
+        if self._single_needle is not None:
+            return self._single_needle in text
+        if self._pattern is None:
+            return False
+        return self._pattern.search(text) is not None
+
+    def restricted_to(self, text: str) -> 'ReplacementSet':
+        """Drop the rules that cannot apply anywhere in the text.
+
+        A rule whose search text does not occur in the text can still match
+        after an earlier rule has rewritten it, so it is only dropped when
+        no earlier kept rule deletes text or writes any of its characters.
+
+        Args:
+            text: All text the rules will be applied to
+
+        Returns:
+            A set with the remaining rules, in order (self if none dropped)
+        """
+        kept = []
+        written_chars: set = set()
+        deletes = False
+        for rule in self.rules:
+            search_text, replace_text = rule
+            if search_text in text or deletes or not written_chars.isdisjoint(search_text):
+                kept.append(rule)
+                written_chars.update(replace_text)
+                deletes = deletes or not replace_text
+
+        if len(kept) == len(self.rules):
+            return self
+        return _compile_replacement_set(tuple(kept))
+
+    @classmethod
+    def coerce(
+        cls,
+        replacements: Union['ReplacementSet', Iterable[Tuple[str, str]]]
+    ) -> 'ReplacementSet':
+        """Get a compiled set for the rules, reusing a cached one if possible.
+
+        Repeated ``replace_text``/``replace_multiple`` calls with the same
+        plain rule list then compile its pattern only once.
+
+        Args:
+            replacements: List of (search_text, replace_text) tuples, or a
+                precompiled ReplacementSet
+
+        Returns:
+            The compiled replacement rules
+        """
+        if isinstance(replacements, cls):
+            return replacements
+        rules = tuple(tuple(rule) for rule in replacements)
+        try:
+            return _compile_replacement_set(rules)
+        except TypeError:
+            # Unhashable search or replacement values
+            return cls(rules)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        return iter(self.rules)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+
+@lru_cache(maxsize=256)
+def _compile_replacement_set(rules: Tuple[Tuple[str, str], ...]) -> ReplacementSet:
+    """Compile rules into a ReplacementSet, cached by the rules themselves.
+
+    Args:
+        rules: Tuple of (search_text, replace_text) tuples
+
+    Returns:
+        The shared compiled set; it is never mutated after construction
+    """
+    return ReplacementSet(rules)
+
+
 class DocxProcessor:
     """Process DOCX documents with format-preserving text replacement.
 
@@ -36,6 +644,23 @@ class DocxProcessor:
         self.backup_path: Optional[str] = None
         self.format_preserver = FormatPreserver()
         self.replacement_count = 0
+        # Names of the XML parts modified by replacements
+        self._changed_parts: set = set()
+
+    def reset(self, doc_path: str) -> None:
+        """Point the processor at another document, dropping all state.
+
+        Lets a worker reuse one processor (and its FormatPreserver) across
+        the files of a batch instead of allocating a new one per file.
+
+        Args:
+            doc_path: Path to the DOCX file
+        """
+        self.close()
+        self.doc_path = doc_path
+        self.backup_path = None
+        self.replacement_count = 0
+        self._changed_parts = set()
 
     def load(self) -> bool:
         """Load the DOCX document.
@@ -59,23 +684,50 @@ class DocxProcessor:
         Returns:
             Path to the backup file
         """
+        backup_path = self.prepare_backup_path(self.doc_path, backup_dir)
+        fast_copy(self.doc_path, backup_path)
+        self.backup_path = backup_path
+        return backup_path
+
+    @staticmethod
+    def prepare_backup_path(doc_path: str, backup_dir: Optional[str] = None) -> str:
+        """Reserve a unique backup file name for a document.
+
+        The name is claimed by creating an empty file exclusively, so
+        concurrent backups of same-named documents never pick the same
+        path even before their contents are copied.
+
+        Args:
+            doc_path: Path to the document to back up
+            backup_dir: Optional directory for backups. Defaults to same directory.
+
+        Returns:
+            Path to the reserved (empty) backup file
+        """
         if backup_dir is None:
-            backup_dir = os.path.dirname(self.doc_path)
+            backup_dir = os.path.dirname(doc_path)
 
-        original_name = os.path.basename(self.doc_path)
+        original_name = os.path.basename(doc_path)
         name, ext = os.path.splitext(original_name)
         backup_name = f"{name}_backup{ext}"
-        backup_path = os.path.join(backup_dir, backup_name)
-
-        # Handle duplicate backup names
-        counter = 1
-        while os.path.exists(backup_path):
-            backup_name = f"{name}_backup_{counter}{ext}"
-            backup_path = os.path.join(backup_dir, backup_name)
-            counter += 1
+        base_path = backup_path = os.path.join(backup_dir, backup_name)
 
-        shutil.copy2(self.doc_path, backup_path)
-        self.backup_path = backup_path
+        # Handle duplicate backup names; numbered names handed out before
+        # are skipped instead of being probed again
+        counter = _BACKUP_COUNTER_HINTS.get(base_path, 1)
+        while True:
+            try:
+                os.close(os.open(backup_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+                break
+            except FileExistsError:
+                backup_name = f"{name}_backup_{counter}{ext}"
+                backup_path = os.path.join(backup_dir, backup_name)
+                counter += 1
+
+        if backup_path != base_path:
+            if len(_BACKUP_COUNTER_HINTS) >= _BACKUP_COUNTER_HINT_LIMIT:
+                _BACKUP_COUNTER_HINTS.clear()
+            _BACKUP_COUNTER_HINTS[base_path] = counter
         return backup_path
 
     def replace_text(
@@ -92,66 +744,180 @@ class DocxProcessor:
         Args:
             search_text: Text to search for
             replace_text: Text to replace with
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback for progress updates, called
+                about every 1% of the paragraphs and tables
 
         Returns:
             Number of replacements made
         """
-        if not self.doc:
+        return self.replace_multiple([(search_text, replace_text)], progress_callback)
+
+    def replace_multiple(
+        self,
+        replacements: Union[ReplacementSet, List[Tuple[str, str]]],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> int:
+        """Replace multiple text patterns in the document.
+
+        The document is walked once over the XML elements. The rules are
+        first narrowed with one scan over all paragraph texts of a part;
+        each paragraph is then prescreened with a single scan of its text and
+        python-docx wrappers are only created for paragraphs that match. The
+        matching rules are then applied in order. The walk is deliberately
+        single-threaded: the python-docx wrappers hold the GIL and lxml
+        trees must not be mutated from several threads. BatchProcessor runs
+        documents in parallel worker processes instead.
+
+        Args:
+            replacements: List of (search_text, replace_text) tuples, or a
+                precompiled ReplacementSet
+            progress_callback: Optional callback for progress updates, called
+                about every 1% of the paragraphs and tables
+
+        Returns:
+            Total number of replacements made
+        """
+        if not self._is_loaded():
             return 0
 
+        replacements = ReplacementSet.coerce(replacements)
+
         self.replacement_count = 0
-        total_items = len(self.doc.paragraphs) + len(self.doc.tables)
+        parts = [
+            (part_name, container, container._element.p_lst, container.tables, part_rules)
+            for part_name, container, part_rules in self._text_containers(replacements)
+        ]
+        total_items = sum(len(paragraphs) + len(tables) for _, _, paragraphs, tables, _ in parts)
         processed_items = 0
+        # Report about every 1% of the items, and always the last one
+        progress_step = max(1, total_items // 100)
+
+        for part_name, container, paragraphs, tables, part_rules in parts:
+            part_count = 0
+
+            # One scan over all paragraph texts drops the rules that cannot
+            # apply to any of them; the separator keeps matches from
+            # spanning paragraphs
+            texts = [_paragraph_text(paragraph_element) for paragraph_element in paragraphs]
+            paragraph_rules = part_rules.restricted_to('\x00'.join(texts))
+
+            # Process paragraphs
+            for paragraph_element, text in zip(paragraphs, texts):
+                if paragraph_rules:
+                    part_count += self._replace_all_in_paragraph(
+                        paragraph_element, container, paragraph_rules, text
+                    )
+                processed_items += 1
+                if progress_callback and (
+                    processed_items % progress_step == 0 or processed_items == total_items
+                ):
+                    progress_callback(processed_items, total_items)
+
+            # Process tables
+            for table in tables:
+                part_count += self._replace_in_table(table, part_rules)
+                processed_items += 1
+                if progress_callback and (
+                    processed_items % progress_step == 0 or processed_items == total_items
+                ):
+                    progress_callback(processed_items, total_items)
+
+            if part_count:
+                self._changed_parts.add(part_name)
+            self.replacement_count += part_count
 
-        # Process paragraphs
-        for paragraph in self.doc.paragraphs:
-            count = self._replace_in_paragraph(paragraph, search_text, replace_text)
-            self.replacement_count += count
-            processed_items += 1
-            if progress_callback:
-                progress_callback(processed_items, total_items)
+        return self.replacement_count
 
-        # Process tables
-        for table in self.doc.tables:
-            count = self._replace_in_table(table, search_text, replace_text)
-            self.replacement_count += count
-            processed_items += 1
-            if progress_callback:
-                progress_callback(processed_items, total_items)
+    def _is_loaded(self) -> bool:
+        """Check whether a document has been loaded."""
+        return self.doc is not None
 
-        return self.replacement_count
+    def _text_containers(
+        self,
+        replacements: ReplacementSet
+    ) -> List[Tuple[str, Any, ReplacementSet]]:
+        """Get the block containers searched by text replacement.
 
-    def replace_multiple(
+        Args:
+            replacements: Rules about to be applied
+
+        Returns:
+            List of (part_name, container, rules) tuples; each container is
+            a BlockItemContainer and ``rules`` are the replacements that may
+            apply to it
+        """
+        return [(DOCUMENT_PART, self.doc._body, replacements)]
+
+    def _replace_all_in_paragraph(
         self,
-        replacements: List[Tuple[str, str]],
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        paragraph_element: CT_P,
+        parent: Any,
+        replacements: ReplacementSet,
+        text: Optional[str] = None
     ) -> int:
-        """Replace multiple text patterns in the document.
+        """Apply all replacement rules to a paragraph, in order.
 
         Args:
-            replacements: List of (search_text, replace_text) tuples
-            progress_callback: Optional callback for progress updates
+            paragraph_element: The ``w:p`` element of the paragraph
+            parent: Block container holding the paragraph
+            replacements: Compiled replacement rules
+            text: Optional paragraph text, if already known
 
         Returns:
-            Total number of replacements made
+            Number of replacements made
         """
-        if not self.doc:
+        if text is None:
+            text = _paragraph_text(paragraph_element)
+        if not replacements.matches(text):
             return 0
 
-        total_replacements = 0
+        paragraph = Paragraph(paragraph_element, parent)
 
-        for search_text, replace_text in replacements:
-            count = self.replace_text(search_text, replace_text, progress_callback)
-            total_replacements += count
+        # Replacing only rewrites run content, so one run list serves all rules
+        runs = paragraph.runs
+        count = 0
+        for pattern, mapping in replacements._stages:
+            if pattern is None:
+                (search_text, replace_text), = mapping.items()
+                count += self._replace_in_paragraph(paragraph, search_text, replace_text, runs)
+            else:
+                count += self._replace_in_paragraph_multi(paragraph, pattern, mapping, runs)
+        return count
 
-        return total_replacements
+    def _replace_in_paragraph_multi(
+        self,
+        paragraph: Paragraph,
+        pattern: Pattern,
+        mapping: Dict[str, str],
+        runs: Optional[List[Any]] = None
+    ) -> int:
+        """Apply independent replacement rules to a paragraph in one scan.
+
+        Args:
+            paragraph: A python-docx Paragraph object
+            pattern: Compiled alternation of the search texts
+            mapping: Replacement text of each search text
+            runs: Optional runs of the paragraph, if already listed
+
+        Returns:
+            Number of replacements made
+        """
+        if runs is None:
+            runs = paragraph.runs
+        run_texts = [run.text for run in runs]
+        paragraph_text = ''.join(run_texts)
+        run_ends = _run_ends(run_texts)
+        hits, matched = _find_pattern_spans(paragraph_text, run_texts, run_ends, pattern)
+        if hits:
+            self._rewrite_runs(runs, run_texts, hits, [mapping[text] for text in matched])
+        return len(hits)
 
     def _replace_in_paragraph(
         self,
         paragraph: Paragraph,
         search_text: str,
-        replace_text: str
+        replace_text: str,
+        runs: Optional[List[Any]] = None
     ) -> int:
         """Replace text in a paragraph while preserving format.
 
@@ -159,98 +925,113 @@ class DocxProcessor:
             paragraph: A python-docx Paragraph object
             search_text: Text to search for
             replace_text: Text to replace with
+            runs: Optional runs of the paragraph, if already listed
 
         Returns:
             Number of replacements made
         """
-        if search_text not in paragraph.text:
+        if runs is None:
+            runs = paragraph.runs
+        run_texts = [run.text for run in runs]
+        paragraph_text = ''.join(run_texts)
+
+        # The first search doubles as the check for any match at all
+        first_index = paragraph_text.find(search_text)
+        if first_index == -1:
             return 0
 
-        count = 0
-        search_start = 0
-
-        while True:
-            paragraph_text = paragraph.text
-            match_index = paragraph_text.find(search_text, search_start)
-            if match_index == -1:
-                break
-
-            start_pos = match_index
-            end_pos = match_index + len(search_text)
-
-            current_pos = 0
-            start_run_idx = None
-            end_run_idx = None
-            start_offset = 0
-            end_offset = 0
-
-            for run_idx, run in enumerate(paragraph.runs):
-                run_text = run.text
-                run_end = current_pos + len(run_text)
-
-                if start_run_idx is None and start_pos < run_end:
-                    start_run_idx = run_idx
-                    start_offset = start_pos - current_pos
-
-                if end_pos <= run_end:
-                    end_run_idx = run_idx
-                    end_offset = end_pos - current_pos
-                    break
+        run_ends = _run_ends(run_texts)
+        hits = _find_spans(paragraph_text, run_texts, run_ends, search_text, first_index)
+        self._rewrite_runs(runs, run_texts, hits, [replace_text] * len(hits))
+        return len(hits)
 
-                current_pos = run_end
-
-            if start_run_idx is None or end_run_idx is None:
-                break
-
-            start_run = paragraph.runs[start_run_idx]
-            end_run = paragraph.runs[end_run_idx]
-            format_data = self.format_preserver.capture_run_format(start_run)
+    def _rewrite_runs(
+        self,
+        runs: List[Any],
+        run_texts: List[str],
+        hits: List[Tuple[int, int, int, int]],
+        replace_texts: List[str]
+    ) -> None:
+        """Write the replacements of a paragraph's matches into its runs.
 
-            new_text = (
-                start_run.text[:start_offset]
-                + replace_text
-                + end_run.text[end_offset:]
+        Args:
+            runs: The paragraph's runs
+            run_texts: Text of each run before replacing
+            hits: Non-overlapping match spans in text order, as returned by
+                ``_find_spans``
+            replace_texts: Replacement text of each match
+        """
+        # Resolve the new run texts back to front, so the offsets of earlier
+        # matches stay valid; a match spanning runs is written into its
+        # first run, whose format is kept, and clears the runs it covers
+        new_texts = list(run_texts)
+        keep_format = set()
+        for hit_idx in range(len(hits) - 1, -1, -1):
+            start_run_idx, start_offset, end_run_idx, end_offset = hits[hit_idx]
+            new_texts[start_run_idx] = (
+                new_texts[start_run_idx][:start_offset]
+                + replace_texts[hit_idx]
+                + new_texts[end_run_idx][end_offset:]
             )
-            start_run.text = new_text
-            self.format_preserver.apply_run_format(start_run, format_data)
-
             for idx in range(start_run_idx + 1, end_run_idx + 1):
-                paragraph.runs[idx].text = ""
-
-            count += 1
-            search_start = match_index + len(replace_text)
-
-        return count
+                new_texts[idx] = ""
+                keep_format.discard(idx)
+            if end_run_idx != start_run_idx:
+                keep_format.add(start_run_idx)
+
+        # Write each affected run once
+        for idx, run in enumerate(runs):
+            if new_texts[idx] == run_texts[idx] and idx not in keep_format:
+                continue
+            if idx in keep_format:
+                format_data = self.format_preserver.capture_run_format(run)
+                _set_run_text(run, new_texts[idx])
+                self.format_preserver.apply_run_format(run, format_data)
+            else:
+                # Setting the text only replaces the text nodes and leaves
+                # rPr untouched, so no format round-trip is needed
+                _set_run_text(run, new_texts[idx])
 
     def _replace_in_table(
         self,
         table: Table,
-        search_text: str,
-        replace_text: str
+        replacements: ReplacementSet
     ) -> int:
         """Replace text in a table while preserving format.
 
+        Nested tables are walked with an explicit stack rather than by
+        recursion. ``row.cells`` returns a merged cell once per grid column
+        it spans and per row it is merged into, so each cell is processed
+        only the first time it is seen; otherwise chained rules would be
+        applied to it again.
+
         Args:
             table: A python-docx Table object
-            search_text: Text to search for
-            replace_text: Text to replace with
+            replacements: Compiled replacement rules
 
         Returns:
             Number of replacements made
         """
         count = 0
-
-        for row in table.rows:
-            for cell in row.cells:
-                # Process paragraphs within the cell
-                for paragraph in cell.paragraphs:
-                    cell_count = self._replace_in_paragraph(paragraph, search_text, replace_text)
-                    count += cell_count
-
-                # Process nested tables
-                for nested_table in cell.tables:
-                    nested_count = self._replace_in_table(nested_table, search_text, replace_text)
-                    count += nested_count
+        pending = deque([table])
+        visited = set()
+
+        while pending:
+            current = pending.pop()
+            for row in current.rows:
+                for cell in row.cells:
+                    if cell._tc in visited:
+                        continue
+                    visited.add(cell._tc)
+
+                    # Process paragraphs within the cell
+                    for paragraph_element in cell._element.p_lst:
+                        count += self._replace_all_in_paragraph(
+                            paragraph_element, cell, replacements
+                        )
+
+                    # Nested tables are processed after this one
+                    pending.extend(cell.tables)
 
         return count
 
@@ -353,22 +1134,255 @@ class DocxProcessor:
             return False
 
         # Check if file exists
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             return False
 
-        # Try to open as a ZIP file (DOCX is a ZIP archive)
+        # DOCX is a ZIP archive with a few mandatory parts
         try:
-            import zipfile
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                # Check for required DOCX files
-                required_files = ['[Content_Types].xml', '_rels/.rels', 'word/document.xml']
-                for req_file in required_files:
-                    if req_file not in zip_ref.namelist():
-                        return False
-            return True
-        except Exception:
+            return _docx_validity_cache(file_path, stat.st_mtime_ns, stat.st_size)
+        except OSError:
             return False
 
     def close(self) -> None:
         """Clean up resources."""
         self.doc = None
+
+
+class FastDocxProcessor(DocxProcessor):
+    """Replace-only DOCX processor that works directly on the ZIP package.
+
+    Instead of building the full python-docx object model (styles,
+    numbering, relationships, media, ...), only the text-bearing XML parts
+    are read: the main document body plus headers and footers. On save the
+    archive is rewritten member by member into a temporary file that then
+    replaces the target. Only the parts that replacements actually changed
+    are re-serialized; every other member keeps its content, name, date
+    and compression method, but is decompressed and compressed again. The
+    file mode of the target is kept; being a new file, it does not keep
+    hard links, ACLs or the Windows creation time.
+
+    Parts are parsed lazily: before applying replacements, the raw XML of
+    each part is scanned for the search texts and parts without a hit are
+    never parsed at all. Simple parts, where every match sits inside one
+    text node, are edited directly as bytes without parsing either.
+    """
+
+    def __init__(self, doc_path: str):
+        """Initialize the processor with a document.
+
+        Args:
+            doc_path: Path to the DOCX file
+        """
+        self._doc: Optional[BlockItemContainer] = None
+        # Part name -> raw XML, document part first
+        self._blobs: Dict[str, bytes] = {}
+        # Part name -> parsed root element, filled on first use
+        self._parts: Dict[str, Any] = {}
+        # Parts handled at byte level by the current replacement pass
+        self._raw_parts: set = set()
+        super().__init__(doc_path)
+
+    @property
+    def doc(self) -> Optional[BlockItemContainer]:
+        """Block container of the document body, parsed on first access."""
+        if self._doc is None and DOCUMENT_PART in self._blobs:
+            self._doc = BlockItemContainer(self._part_element(DOCUMENT_PART).body, None)
+        return self._doc
+
+    @doc.setter
+    def doc(self, value: Optional[BlockItemContainer]) -> None:
+        self._doc = value
+
+    def load(self) -> bool:
+        """Read the text-bearing XML parts of the DOCX package.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with zipfile.ZipFile(self.doc_path, 'r') as zip_ref:
+                blobs = {DOCUMENT_PART: zip_ref.read(DOCUMENT_PART)}
+                for name in zip_ref.namelist():
+                    if _HEADER_FOOTER_PART.match(name):
+                        blobs[name] = zip_ref.read(name)
+            self._blobs = blobs
+            self._parts = {}
+            self.doc = None
+            self._changed_parts = set()
+            return True
+        except Exception as e:
+            print(f"Error loading document {self.doc_path}: {e}")
+            self._blobs = {}
+            self._parts = {}
+            return False
+
+    def validate_document(self) -> Tuple[bool, List[str]]:
+        """Validate that the document part was read from the package.
+
+        The XML itself is parsed on first use, so malformed markup is
+        reported by the replacement or save step instead.
+
+        Returns:
+            Tuple of (is_valid, list_of_errors)
+        """
+        if not self._is_loaded():
+            return False, ["Document not loaded"]
+        return True, []
+
+    def _is_loaded(self) -> bool:
+        """Check whether a document has been loaded."""
+        return DOCUMENT_PART in self._blobs
+
+    def replace_multiple(
+        self,
+        replacements: Union[ReplacementSet, List[Tuple[str, str]]],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> int:
+        """Replace multiple text patterns in the document.
+
+        Unparsed parts are first tried at byte level; the rest go through
+        the element tree. Parsed parts that end up unchanged are released
+        afterwards; they are copied from the source archive on save and
+        re-parsed from the raw XML if a later call needs them.
+
+        Args:
+            replacements: List of (search_text, replace_text) tuples, or a
+                precompiled ReplacementSet
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            Total number of replacements made
+        """
+        replacements = ReplacementSet.coerce(replacements)
+
+        raw_count = 0
+        self._raw_parts = set()
+        for part_name, blob in list(self._blobs.items()):
+            if part_name in self._parts:
+                continue
+            result = _replace_in_raw_xml(blob, replacements)
+            if result is None:
+                continue
+            self._blobs[part_name], part_count = result
+            self._raw_parts.add(part_name)
+            if part_count:
+                self._changed_parts.add(part_name)
+                raw_count += part_count
+
+        self.replacement_count = super().replace_multiple(replacements, progress_callback) + raw_count
+        self._raw_parts = set()
+
+        for part_name in list(self._parts):
+            if part_name not in self._changed_parts:
+                del self._parts[part_name]
+                if part_name == DOCUMENT_PART:
+                    self.doc = None
+        return self.replacement_count
+
+    def _part_element(self, part_name: str) -> Any:
+        """Get the parsed root element of a part, parsing it if needed.
+
+        Args:
+            part_name: Name of the part inside the package
+
+        Returns:
+            The root element of the part
+        """
+        element = self._parts.get(part_name)
+        if element is None:
+            element = self._parts[part_name] = parse_xml(self._blobs[part_name])
+        return element
+
+    def _text_containers(
+        self,
+        replacements: ReplacementSet
+    ) -> List[Tuple[str, Any, ReplacementSet]]:
+        """Get the block containers of the body, headers and footers.
+
+        Rules are narrowed per part to those whose search text occurs in
+        the part's raw XML; parts left without rules are skipped unparsed.
+
+        Args:
+            replacements: Rules about to be applied
+
+        Returns:
+            List of (part_name, container, rules) tuples
+        """
+        containers = []
+        for part_name, blob in self._blobs.items():
+            if part_name in self._raw_parts:
+                continue
+            part_rules = replacements
+            if part_name not in self._parts:
+                raw_text = _raw_part_text(blob)
+                if raw_text is not None:
+                    part_rules = replacements.restricted_to(raw_text)
+                    if not part_rules:
+                        continue
+
+            if part_name == DOCUMENT_PART:
+                container = self.doc
+            else:
+                container = BlockItemContainer(self._part_element(part_name), None)
+            containers.append((part_name, container, part_rules))
+        return containers
+
+    def save(self, output_path: Optional[str] = None) -> bool:
+        """Save the document, rewriting only the changed XML parts.
+
+        Args:
+            output_path: Optional path to save to. Defaults to original path.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._is_loaded():
+            return False
+
+        save_path = output_path or self.doc_path
+        same_file = os.path.abspath(save_path) == os.path.abspath(self.doc_path)
+        if same_file and not self._changed_parts:
+            # Nothing was replaced, the file on disk is already up to date
+            return True
+
+        tmp_path = None
+        try:
+            serialized: Dict[str, bytes] = {}
+            tmp_path, tmp_file = _create_temp_file(save_path)
+            with tmp_file, zipfile.ZipFile(self.doc_path, 'r') as zip_in, \
+                    zipfile.ZipFile(tmp_file, 'w') as zip_out:
+                for info in zip_in.infolist():
+                    if info.filename in self._parts and info.filename in self._changed_parts:
+                        data = serialized[info.filename] = serialize_part_xml(
+                            self._parts[info.filename]
+                        )
+                    elif info.filename in self._changed_parts:
+                        # Edited at byte level
+                        data = self._blobs[info.filename]
+                    else:
+                        data = zip_in.read(info)
+                    # Reusing the ZipInfo keeps compress_type and date_time
+                    zip_out.writestr(info, data)
+            if os.path.exists(save_path):
+                # The new file would otherwise get default permissions
+                shutil.copymode(save_path, tmp_path)
+            os.replace(tmp_path, save_path)
+            # Keep the raw XML in step with the parsed trees, so a part that
+            # is released later is re-parsed with its edits
+            self._blobs.update(serialized)
+            if same_file:
+                self._changed_parts = set()
+            return True
+        except Exception as e:
+            print(f"Error saving document: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+    def close(self) -> None:
+        """Clean up resources."""
+        super().close()
+        self._blobs = {}
+        self._parts = {}
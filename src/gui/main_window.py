@@ -4,37 +4,133 @@ This module provides the main GUI window that integrates all components
 of the application.
 """
 
-import os
-from typing import Optional
+import time
+from queue import SimpleQueue, Empty
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QCheckBox, QSplitter, QMessageBox,
     QFileDialog, QApplication
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QIcon
 
 from .widgets import FileListWidget, ReplacementRulesWidget, ProgressWidget, LogWidget
-from core.batch_processor import BatchProcessor, ProcessingResult
+
+if TYPE_CHECKING:
+    # Imported on first use: loading python-docx and lxml would delay the
+    # window appearing
+    from core.batch_processor import BatchProcessor, ProcessingResult
+
+
+# Minimum time between progress updates that advance less than 0.5%
+PROGRESS_INTERVAL_S = 0.05
+
+# How often results of the processing thread are shown while processing
+RESULT_DRAIN_INTERVAL_MS = 50
+
+# Results shown per drain at most
+RESULT_DRAIN_LIMIT = 500
+
+
+class BatchWorker(QObject):
+    """Worker running batch processing on the persistent worker thread."""
+
+    finished = pyqtSignal(object)  # Emits the error message, or None
+
+    def __init__(
+        self,
+        progress_callback: Callable[[int, int], None],
+        result_callback: Callable[['ProcessingResult'], None]
+    ):
+        """Initialize batch worker.
+
+        Args:
+            progress_callback: Callback for progress updates
+            result_callback: Callback for individual results
+        """
+        super().__init__()
+        self.progress_callback = progress_callback
+        self.result_callback = result_callback
+
+    @pyqtSlot(object, object, object, bool, object)
+    def run(
+        self,
+        processor: 'BatchProcessor',
+        files: List[str],
+        rules: List[Tuple[str, str]],
+        create_backup: bool,
+        backup_dir: Optional[str]
+    ) -> None:
+        """Process documents and emit ``finished``.
+
+        Args:
+            processor: Batch processor running the documents
+            files: List of file paths to process
+            rules: List of (search, replace) tuples
+            create_backup: Whether to create backups
+            backup_dir: Optional backup directory
+        """
+        error = None
+        try:
+            processor.process_documents(
+                files,
+                rules,
+                create_backup,
+                backup_dir,
+                self.progress_callback,
+                self.result_callback
+            )
+        except Exception as e:
+            error = str(e)
+        self.finished.emit(error)
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
-    logMessage = pyqtSignal(str, str)
     progressUpdated = pyqtSignal(int, int)
     statisticsUpdated = pyqtSignal(object)
+    processingRequested = pyqtSignal(object, object, object, bool, object)
 
     def __init__(self):
         """Initialize main window."""
         super().__init__()
 
-        self.batch_processor = BatchProcessor()
+        self._batch_processor: Optional['BatchProcessor'] = None
         self.is_processing = False
 
+        # Running totals of the current run
+        self._running_stats = self._empty_statistics()
+
+        # Results put by the processing thread; the UI thread drains them on a
+        # timer and updates the log and statistics together
+        self._result_queue: SimpleQueue = SimpleQueue()
+        self._result_timer = QTimer(self)
+        self._result_timer.setInterval(RESULT_DRAIN_INTERVAL_MS)
+        self._result_timer.timeout.connect(self._drain_results)
+
+        # Last progress update sent to the UI
+        self._last_progress_emit = 0.0
+        self._last_progress_current = -1
+
+        # Processing runs on one long-lived thread, started by the first run
+        # and reused by the following ones
+        self._worker = BatchWorker(self.update_progress, self.handle_result)
+        self._worker_thread = QThread(self)
+        self._worker.moveToThread(self._worker_thread)
+
         self.init_ui()
         self.setup_connections()
 
+    @property
+    def batch_processor(self) -> 'BatchProcessor':
+        """Batch processor of the window, created on first use."""
+        if self._batch_processor is None:
+            from core.batch_processor import BatchProcessor
+            self._batch_processor = BatchProcessor()
+        return self._batch_processor
+
     def init_ui(self):
         """Initialize user interface."""
         self.setWindowTitle("DOCX 批量更新器")
@@ -161,10 +257,16 @@ class MainWindow(QMainWindow):
         self.backup_checkbox.stateChanged.connect(self.on_backup_checkbox_changed)
 
         # Thread-safe UI update signals
-        self.logMessage.connect(self.log_widget.log)
         self.progressUpdated.connect(self.progress_widget.set_progress)
         self.statisticsUpdated.connect(self.progress_widget.set_statistics)
 
+        # Processing requests and completion, queued across the worker thread
+        self.processingRequested.connect(self._worker.run)
+        self._worker.finished.connect(self.processing_finished)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop_worker_thread)
+
     def on_backup_checkbox_changed(self, state: int) -> None:
         """Handle backup checkbox state change.
 
@@ -188,8 +290,8 @@ class MainWindow(QMainWindow):
 
     def update_process_button(self) -> None:
         """Update process button state based on file and rule counts."""
-        has_files = len(self.file_list_widget.get_files()) > 0
-        has_rules = len(self.rules_widget.get_rules()) > 0
+        has_files = self.file_list_widget.count() > 0
+        has_rules = self.rules_widget.count() > 0
 
         self.process_btn.setEnabled(has_files and has_rules and not self.is_processing)
 
@@ -231,55 +333,33 @@ class MainWindow(QMainWindow):
         self.progress_widget.set_status("开始处理…")
 
         # Log start
-        self.log_widget.log("=" * 50, "INFO")
-        self.log_widget.log("开始批量处理", "INFO")
-        self.log_widget.log(f"文件数：{len(files)}", "INFO")
-        self.log_widget.log(f"规则数：{len(rules)}", "INFO")
-        self.log_widget.log(f"备份：{'是' if self.backup_checkbox.isChecked() else '否'}", "INFO")
+        entries = [
+            ("=" * 50, "INFO"),
+            ("开始批量处理", "INFO"),
+            (f"文件数：{len(files)}", "INFO"),
+            (f"规则数：{len(rules)}", "INFO"),
+            (f"备份：{'是' if self.backup_checkbox.isChecked() else '否'}", "INFO"),
+        ]
         if self.backup_checkbox.isChecked() and self.backup_dir:
-            self.log_widget.log(f"备份目录：{self.backup_dir}", "INFO")
-        self.log_widget.log("=" * 50, "INFO")
-
-        # Start processing in thread
-        from PyQt5.QtCore import QThread
-
-        class ProcessingThread(QThread):
-            def __init__(self, processor, files, rules, create_backup, backup_dir,
-                         progress_callback, result_callback):
-                super().__init__()
-                self.processor = processor
-                self.files = files
-                self.rules = rules
-                self.create_backup = create_backup
-                self.backup_dir = backup_dir
-                self.progress_callback = progress_callback
-                self.result_callback = result_callback
-                self.error: Optional[str] = None
-
-            def run(self):
-                try:
-                    self.processor.process_documents(
-                        self.files,
-                        self.rules,
-                        self.create_backup,
-                        self.backup_dir,
-                        self.progress_callback,
-                        self.result_callback
-                    )
-                except Exception as e:
-                    self.error = str(e)
-
-        self.processing_thread = ProcessingThread(
+            entries.append((f"备份目录：{self.backup_dir}", "INFO"))
+        entries.append(("=" * 50, "INFO"))
+        self.log_widget.log_bulk(entries)
+
+        self._running_stats = self._empty_statistics()
+        self._last_progress_emit = 0.0
+        self._last_progress_current = -1
+        self._result_timer.start()
+
+        # Start processing on the worker thread
+        if not self._worker_thread.isRunning():
+            self._worker_thread.start()
+        self.processingRequested.emit(
             self.batch_processor,
             files,
             rules,
             self.backup_checkbox.isChecked(),
-            self.backup_dir,
-            self.update_progress,
-            self.handle_result
+            self.backup_dir
         )
-        self.processing_thread.finished.connect(self.processing_finished)
-        self.processing_thread.start()
 
     def stop_processing(self) -> None:
         """Stop current processing."""
@@ -289,45 +369,95 @@ class MainWindow(QMainWindow):
     def update_progress(self, current: int, total: int) -> None:
         """Update progress display.
 
+        Updates that advance less than 0.5% within ``PROGRESS_INTERVAL_S``
+        of the previous one are dropped, so the UI thread is not flooded
+        with queued signals on large batches.
+
         Args:
             current: Current progress value
             total: Total value
         """
-        self.progressUpdated.emit(current, total)
-
-    def log_async(self, message: str, level: str = "INFO") -> None:
-        """Thread-safe log helper."""
-        self.logMessage.emit(message, level)
-
-    def handle_result(self, result: ProcessingResult) -> None:
+        now = time.monotonic()
+        step = max(1, total // 200)
+        if (
+            current - self._last_progress_current >= step
+            or now - self._last_progress_emit >= PROGRESS_INTERVAL_S
+            or current == total
+        ):
+            self._last_progress_current = current
+            self._last_progress_emit = now
+            self.progressUpdated.emit(current, total)
+
+    def handle_result(self, result: 'ProcessingResult') -> None:
         """Handle individual document processing result.
 
+        Called on the processing thread; the result is queued and shown by
+        the UI thread every ``RESULT_DRAIN_INTERVAL_MS``, instead of posting
+        log and statistics events for each file.
+
         Args:
             result: Processing result
         """
-        filename = os.path.basename(result.file_path)
+        self._result_queue.put_nowait(result)
 
-        if result.success:
-            self.log_async(
-                f"{filename}：成功（替换 {result.replacements} 次）",
-                "SUCCESS"
-            )
-        else:
-            self.log_async(
-                f"{filename}：失败 - {result.message}",
-                "ERROR"
-            )
+    def _drain_results(self, limit: Optional[int] = RESULT_DRAIN_LIMIT) -> None:
+        """Log queued results and update the running statistics.
 
-        # Update statistics
-        summary = self.batch_processor.get_summary()
-        self.statisticsUpdated.emit(summary)
+        Args:
+            limit: Maximum number of results to take, None for all
+        """
+        entries = []
+        stats = self._running_stats
+        while limit is None or len(entries) < limit:
+            try:
+                result = self._result_queue.get_nowait()
+            except Empty:
+                break
+
+            if result.success:
+                entries.append((
+                    f"{result.basename}：成功（替换 {result.replacements} 次）",
+                    "SUCCESS"
+                ))
+                stats['successful'] += 1
+            else:
+                entries.append((f"{result.basename}：失败 - {result.message}", "ERROR"))
+                stats['failed'] += 1
+            stats['total_files'] += 1
+            stats['total_replacements'] += result.replacements
+
+        if entries:
+            stats['success_rate'] = stats['successful'] / stats['total_files']
+            self.log_widget.log_bulk(entries)
+            self.statisticsUpdated.emit(dict(stats))
+
+    @staticmethod
+    def _empty_statistics() -> dict:
+        """Get statistics of a run without results.
+
+        Returns:
+            Dictionary with the keys of ``BatchProcessor.get_summary``
+        """
+        return {
+            'total_files': 0,
+            'successful': 0,
+            'failed': 0,
+            'total_replacements': 0,
+            'success_rate': 0
+        }
+
+    def processing_finished(self, thread_error: Optional[str] = None) -> None:
+        """Handle processing completion.
 
-    def processing_finished(self) -> None:
-        """Handle processing completion."""
+        Args:
+            thread_error: Message of an exception raised while processing
+        """
         self.is_processing = False
+        self._result_timer.stop()
+        self._drain_results(limit=None)
         self.process_btn.setEnabled(
-            len(self.file_list_widget.get_files()) > 0 and
-            len(self.rules_widget.get_rules()) > 0
+            self.file_list_widget.count() > 0 and
+            self.rules_widget.count() > 0
         )
         self.stop_btn.setEnabled(False)
         self.file_list_widget.setEnabled(True)
@@ -335,7 +465,6 @@ class MainWindow(QMainWindow):
         self.backup_checkbox.setEnabled(True)
         self.backup_dir_btn.setEnabled(self.backup_checkbox.isChecked())
 
-        thread_error = getattr(self.processing_thread, 'error', None)
         if thread_error:
             self.log_widget.log(f"处理线程异常：{thread_error}", "ERROR")
             QMessageBox.critical(self, "处理失败", f"处理过程中发生未捕获异常：\n{thread_error}")
@@ -346,23 +475,25 @@ class MainWindow(QMainWindow):
         summary = self.batch_processor.get_summary()
 
         # Log completion
-        self.log_widget.log("=" * 50, "INFO")
-        self.log_widget.log("处理完成", "INFO")
-        self.log_widget.log(f"总文件数：{summary['total_files']}", "INFO")
-        self.log_widget.log(f"成功：{summary['successful']}", "INFO")
-        self.log_widget.log(f"失败：{summary['failed']}", "INFO")
-        self.log_widget.log(f"总替换次数：{summary['total_replacements']}", "INFO")
-        self.log_widget.log(f"成功率：{summary['success_rate']:.1%}", "INFO")
+        entries = [
+            ("=" * 50, "INFO"),
+            ("处理完成", "INFO"),
+            (f"总文件数：{summary['total_files']}", "INFO"),
+            (f"成功：{summary['successful']}", "INFO"),
+            (f"失败：{summary['failed']}", "INFO"),
+            (f"总替换次数：{summary['total_replacements']}", "INFO"),
+            (f"成功率：{summary['success_rate']:.1%}", "INFO"),
+        ]
 
         if summary['failed'] > 0:
-            self.log_widget.log("\n失败文件：", "WARNING")
-            for result in self.batch_processor.get_failed_results():
-                self.log_widget.log(
-                    f"  - {os.path.basename(result.file_path)}：{result.message}",
-                    "WARNING"
-                )
+            entries.append(("\n失败文件：", "WARNING"))
+            entries.extend(
+                (f"  - {result.basename}：{result.message}", "WARNING")
+                for result in self.batch_processor.get_failed_results()
+            )
 
-        self.log_widget.log("=" * 50, "INFO")
+        entries.append(("=" * 50, "INFO"))
+        self.log_widget.log_bulk(entries)
 
         # Show summary message
         self.progress_widget.set_status("处理完成")
@@ -383,3 +514,19 @@ class MainWindow(QMainWindow):
                 f"成功处理 {summary['successful']} 个文件。\n"
                 f"总替换次数：{summary['total_replacements']}"
             )
+
+    def closeEvent(self, event) -> None:
+        """Stop processing and the worker thread when the window closes.
+
+        Args:
+            event: Close event
+        """
+        self.stop_worker_thread()
+        super().closeEvent(event)
+
+    def stop_worker_thread(self) -> None:
+        """Stop processing and wait for the worker thread to exit."""
+        if self.is_processing and self._batch_processor is not None:
+            self._batch_processor.stop()
+        self._worker_thread.quit()
+        self._worker_thread.wait()
@@ -5,14 +5,149 @@ file list management and replacement rule configuration.
 """
 
 import os
-from typing import List, Optional, Tuple, Callable
+import sys
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, Callable
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget,
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListView, QListWidget,
     QListWidgetItem, QLineEdit, QLabel, QCheckBox, QGroupBox,
     QFileDialog, QMessageBox, QProgressBar, QTextEdit, QSplitter
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont, QColor, QTextCharFormat, QTextCursor
+
+
+# How long LogWidget buffers messages before writing them
+LOG_FLUSH_INTERVAL_MS = 80
+
+# Items laid out per pass by the file and rule lists
+LIST_BATCH_SIZE = 200
+
+# Number of log lines kept; older lines are dropped
+LOG_MAX_LINES = 5000
+
+
+def _path_key(path: str) -> str:
+    """Get the key identifying a file path in the file list.
+
+    File dialogs and folder scans spell the same file differently on
+    Windows (separators, letter case), so paths are compared normalized.
+
+    Args:
+        path: File path
+
+    Returns:
+        Normalized path
+    """
+    return os.path.normcase(os.path.normpath(path))
+
+
+class FolderScanThread(QThread):
+    """Thread collecting the DOCX files of a folder tree."""
+
+    resultReady = pyqtSignal(list)  # Emits the list of file paths
+
+    def __init__(self, folder: str):
+        """Initialize folder scan thread.
+
+        Args:
+            folder: Folder to scan recursively
+        """
+        super().__init__()
+        self.folder = folder
+
+    def run(self) -> None:
+        """Walk the folder and emit the files found."""
+        from core.batch_processor import BatchProcessor
+
+        # Walks the tree with os.scandir, which avoids a stat per entry
+        self.resultReady.emit(BatchProcessor.get_files_from_directory(self.folder, recursive=True))
+
+
+class FileListModel(QAbstractListModel):
+    """List model of the files to process.
+
+    Rows are plain paths; the view asks for the names of visible rows only,
+    so no item object is created per file.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        """Initialize file list model.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._paths: List[str] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of files.
+
+        Args:
+            parent: Parent index; a list has no children
+
+        Returns:
+            Number of rows
+        """
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Get the data of a row.
+
+        Args:
+            index: Row index
+            role: Data role
+
+        Returns:
+            File name for display, full path for tooltip and user roles
+        """
+        if not index.isValid():
+            return None
+        path = self._paths[index.row()]
+        if role == Qt.DisplayRole:
+            # os.path.basename without its per-call overhead; file dialogs
+            # on Windows return '/' separated paths
+            name = path.rpartition(os.sep)[2]
+            if os.altsep:
+                name = name.rpartition(os.altsep)[2]
+            return name
+        if role in (Qt.ToolTipRole, Qt.UserRole):
+            return path
+        return None
+
+    def append_paths(self, paths: List[str]) -> None:
+        """Append files as one row insertion.
+
+        Args:
+            paths: File paths to append
+        """
+        if not paths:
+            return
+        first = len(self._paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(paths) - 1)
+        self._paths.extend(paths)
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> str:
+        """Remove one file.
+
+        Args:
+            row: Row of the file
+
+        Returns:
+            Path of the removed file
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        path = self._paths.pop(row)
+        self.endRemoveRows()
+        return path
+
+    def clear(self) -> None:
+        """Remove all files."""
+        self.beginResetModel()
+        self._paths.clear()
+        self.endResetModel()
 
 
 class FileListWidget(QWidget):
@@ -28,13 +163,22 @@ class FileListWidget(QWidget):
         """
         super().__init__(parent)
 
-        self.files: List[str] = []
+        # Listed paths by _path_key, in list order; a dict gives
+        # constant-time duplicate checks and removal
+        self.files: Dict[str, str] = {}
+        self._scan_thread: Optional[FolderScanThread] = None
 
         layout = QVBoxLayout(self)
 
         # File list
-        self.file_list = QListWidget()
-        self.file_list.setSelectionMode(QListWidget.SingleSelection)
+        self.file_model = FileListModel(self)
+        self.file_list = QListView()
+        self.file_list.setModel(self.file_model)
+        self.file_list.setSelectionMode(QListView.SingleSelection)
+        # All rows are one line high, so rows need not be measured one by one
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.setLayoutMode(QListView.Batched)
+        self.file_list.setBatchSize(LIST_BATCH_SIZE)
         layout.addWidget(self.file_list)
 
         # Button row
@@ -72,15 +216,7 @@ class FileListWidget(QWidget):
         )
 
         if files:
-            for file in files:
-                if file not in self.files:
-                    self.files.append(file)
-                    item = QListWidgetItem(os.path.basename(file))
-                    item.setData(Qt.UserRole, file)
-                    item.setToolTip(file)
-                    self.file_list.addItem(item)
-
-            self._update_count()
+            self._add_paths(files)
 
     def add_folder(self) -> None:
         """Add all DOCX files from a folder."""
@@ -90,36 +226,58 @@ class FileListWidget(QWidget):
         )
 
         if folder:
-            docx_files = []
-            for root, _, files in os.walk(folder):
-                for file in files:
-                    if file.lower().endswith('.docx'):
-                        docx_files.append(os.path.join(root, file))
-
-            for file in docx_files:
-                if file not in self.files:
-                    self.files.append(file)
-                    item = QListWidgetItem(os.path.basename(file))
-                    item.setData(Qt.UserRole, file)
-                    item.setToolTip(file)
-                    self.file_list.addItem(item)
+            # Large trees or network shares can take a while to walk, so the
+            # scan runs off the GUI thread and the files are added when done
+            self.add_folder_btn.setEnabled(False)
+            self.file_count_label.setText("正在扫描文件夹…")
+            self._scan_thread = FolderScanThread(folder)
+            self._scan_thread.resultReady.connect(self._on_scan_complete)
+            self._scan_thread.start()
 
-            self._update_count()
+    def _on_scan_complete(self, paths: List[str]) -> None:
+        """Add the DOCX files found by a folder scan.
+
+        Args:
+            paths: File paths found in the folder
+        """
+        # The result is emitted at the very end of run(); let the thread
+        # finish before releasing it
+        self._scan_thread.wait()
+        self._scan_thread = None
+        self.add_folder_btn.setEnabled(True)
+        self._add_paths(paths)
+
+    def _add_paths(self, paths: List[str]) -> None:
+        """Append files that are not listed yet.
+
+        New files reach the view as a single row insertion and the count is
+        emitted once, however many files a folder adds.
+
+        Args:
+            paths: File paths to add
+        """
+        new_paths = []
+        for file in paths:
+            key = _path_key(file)
+            if key not in self.files:
+                self.files[key] = file
+                new_paths.append(file)
+        self.file_model.append_paths(new_paths)
+
+        self._update_count()
 
     def remove_selected(self) -> None:
         """Remove the currently selected file from the list."""
-        current_row = self.file_list.currentRow()
-        if current_row >= 0:
-            item = self.file_list.takeItem(current_row)
-            file_path = item.data(Qt.UserRole)
-            if file_path in self.files:
-                self.files.remove(file_path)
+        current = self.file_list.currentIndex()
+        if current.isValid():
+            file_path = self.file_model.remove_row(current.row())
+            self.files.pop(_path_key(file_path), None)
             self._update_count()
 
     def clear_all(self) -> None:
         """Clear all files from the list."""
         self.files.clear()
-        self.file_list.clear()
+        self.file_model.clear()
         self._update_count()
 
     def get_files(self) -> List[str]:
@@ -128,7 +286,15 @@ class FileListWidget(QWidget):
         Returns:
             List of file paths
         """
-        return self.files.copy()
+        return list(self.files.values())
+
+    def count(self) -> int:
+        """Get the number of selected files without copying the list.
+
+        Returns:
+            Number of files
+        """
+        return len(self.files)
 
     def _update_count(self) -> None:
         """Update the file count label."""
@@ -161,6 +327,10 @@ class ReplacementRulesWidget(QWidget):
         # Rule list
         self.rule_list = QListWidget()
         self.rule_list.setSelectionMode(QListWidget.SingleSelection)
+        # All rows are one line high, so rows need not be measured one by one
+        self.rule_list.setUniformItemSizes(True)
+        self.rule_list.setLayoutMode(QListView.Batched)
+        self.rule_list.setBatchSize(LIST_BATCH_SIZE)
         rules_layout.addWidget(self.rule_list)
 
         # Add rule form
@@ -211,11 +381,14 @@ class ReplacementRulesWidget(QWidget):
             QMessageBox.warning(self, "提示", "请输入要查找的文本。")
             return
 
-        self.rules.append((search_text, replace_text))
+        # Interned so repeated search/replace texts share one string, and the
+        # same tuple is kept by the list and the item
+        rule = (sys.intern(search_text), sys.intern(replace_text))
+        self.rules.append(rule)
 
         display_text = f"'{search_text}' → '{replace_text}'"
         item = QListWidgetItem(display_text)
-        item.setData(Qt.UserRole, (search_text, replace_text))
+        item.setData(Qt.UserRole, rule)
         self.rule_list.addItem(item)
 
         # Clear inputs
@@ -229,10 +402,9 @@ class ReplacementRulesWidget(QWidget):
         """Remove the currently selected rule."""
         current_row = self.rule_list.currentRow()
         if current_row >= 0:
-            item = self.rule_list.takeItem(current_row)
-            rule_data = item.data(Qt.UserRole)
-            if rule_data in self.rules:
-                self.rules.remove(rule_data)
+            # Rows and self.rules are kept in the same order
+            self.rule_list.takeItem(current_row)
+            del self.rules[current_row]
             self._update_count()
 
     def clear_all(self) -> None:
@@ -249,6 +421,14 @@ class ReplacementRulesWidget(QWidget):
         """
         return self.rules.copy()
 
+    def count(self) -> int:
+        """Get the number of rules without copying the list.
+
+        Returns:
+            Number of rules
+        """
+        return len(self.rules)
+
     def _update_count(self) -> None:
         """Update the rule count label."""
         count = len(self.rules)
@@ -292,9 +472,13 @@ class ProgressWidget(QWidget):
             total: Total value
         """
         if total > 0:
+            # Skip updates that would not change what is shown
             percentage = int((current / total) * 100)
-            self.progress_bar.setValue(percentage)
-            self.progress_label.setText(f"处理中：{current}/{total} 个文件")
+            if percentage != self.progress_bar.value():
+                self.progress_bar.setValue(percentage)
+            text = f"处理中：{current}/{total} 个文件"
+            if text != self.progress_label.text():
+                self.progress_label.setText(text)
 
     def set_status(self, status: str) -> None:
         """Set status message.
@@ -310,11 +494,13 @@ class ProgressWidget(QWidget):
         Args:
             stats: Dictionary of statistics
         """
-        text = f"Total: {stats.get('total_files', 0)} | "
-        text += f"成功: {stats.get('successful', 0)} | "
-        text += f"失败: {stats.get('failed', 0)} | "
-        text += f"替换次数: {stats.get('total_replacements', 0)}"
-        self.stats_label.setText(text)
+        get = stats.get
+        text = (
+            f"Total: {get('total_files', 0)} | 成功: {get('successful', 0)} | "
+            f"失败: {get('failed', 0)} | 替换次数: {get('total_replacements', 0)}"
+        )
+        if text != self.stats_label.text():
+            self.stats_label.setText(text)
 
     def reset(self) -> None:
         """Reset progress widget."""
@@ -326,6 +512,13 @@ class ProgressWidget(QWidget):
 class LogWidget(QWidget):
     """Widget for displaying processing log."""
 
+    _LEVEL_COLORS = {
+        "INFO": "black",
+        "WARNING": "#8B8000",  # Dark yellow
+        "ERROR": "#B22222",  # Firebrick red
+        "SUCCESS": "#228B22"  # Forest green
+    }
+
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize log widget.
 
@@ -340,8 +533,29 @@ class LogWidget(QWidget):
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setFont(QFont("Courier New", 9))
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_LINES)
         layout.addWidget(self.log_text)
 
+        # Character formats of the timestamp, the level tags and the message,
+        # so lines are inserted as text instead of being parsed from HTML
+        self._timestamp_format = QTextCharFormat()
+        self._timestamp_format.setForeground(QColor("gray"))
+        self._level_formats = {
+            level: self._level_format(color) for level, color in self._LEVEL_COLORS.items()
+        }
+        self._message_format = QTextCharFormat()
+
+        # Second and text of the last timestamp
+        self._timestamp_second = -1
+        self._timestamp_text = ""
+
+        # (timestamp, level, message) lines waiting for the next flush
+        self._pending: Deque[Tuple[str, str, str]] = deque()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
         # Buttons
         button_layout = QHBoxLayout()
 
@@ -358,35 +572,125 @@ class LogWidget(QWidget):
     def log(self, message: str, level: str = "INFO") -> None:
         """Add a message to the log.
 
+        Messages are buffered and written to the log together every
+        ``LOG_FLUSH_INTERVAL_MS``, so a burst of per-file messages costs one
+        layout and repaint instead of one per message.
+
         Args:
             message: Message to log
             level: Log level (INFO, WARNING, ERROR)
         """
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-
-        color_map = {
-            "INFO": "black",
-            "WARNING": "#8B8000",  # Dark yellow
-            "ERROR": "#B22222",  # Firebrick red
-            "SUCCESS": "#228B22"  # Forest green
-        }
+        self._pending.append((self._timestamp(), level, message))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
-        color = color_map.get(level, "black")
+    def log_bulk(self, entries: List[Tuple[str, str]]) -> None:
+        """Add several messages to the log right away, in one document edit.
 
-        html = f'<span style="color:gray;">[{timestamp}]</span> '
-        html += f'<span style="color:{color}; font-weight:bold;">[{level}]</span> '
-        html += f'<span>{message}</span><br>'
+        Args:
+            entries: List of (message, level) tuples
+        """
+        timestamp = self._timestamp()
+        self._pending.extend((timestamp, level, message) for message, level in entries)
+        self._flush()
+
+    def _timestamp(self) -> str:
+        """Get the timestamp of a new log line.
 
-        self.log_text.append(html)
+        Lines logged within the same second share one formatted string.
+
+        Returns:
+            Local time as HH:MM:SS
+        """
+        second = int(time.time())
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp_text = time.strftime("%H:%M:%S", time.localtime(second))
+        return self._timestamp_text
+
+    @staticmethod
+    def _level_format(color: str) -> QTextCharFormat:
+        """Create the character format of a level tag.
+
+        Args:
+            color: Color name of the level
+
+        Returns:
+            Bold character format in the given color
+        """
+        char_format = QTextCharFormat()
+        char_format.setForeground(QColor(color))
+        char_format.setFontWeight(QFont.Bold)
+        return char_format
+
+    def _flush(self) -> None:
+        """Write the buffered log lines.
+
+        Repainting is suspended while the lines are inserted at the end in
+        one document edit, so the log is laid out and painted once. The view
+        follows the new lines if it was scrolled to the bottom.
+        """
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+
+        # Lines beyond the cap would be dropped right after being laid out
+        max_lines = self.log_text.document().maximumBlockCount()
+        while max_lines > 0 and len(self._pending) > max_lines:
+            self._pending.popleft()
+
+        document = self.log_text.document()
+        scroll_bar = self.log_text.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+
+        updates_enabled = self.log_text.updatesEnabled()
+        self.log_text.setUpdatesEnabled(False)
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        try:
+            new_block = not document.isEmpty()
+            while self._pending:
+                timestamp, level, message = self._pending.popleft()
+                level_format = self._level_formats.get(level)
+                if level_format is None:
+                    level_format = self._level_formats["INFO"]
+
+                # One block per line, as counted by the maximum block count
+                if new_block:
+                    cursor.insertBlock()
+                new_block = True
+                cursor.insertText(f"[{timestamp}] ", self._timestamp_format)
+                cursor.insertText(f"[{level}] ", level_format)
+                cursor.insertText(message, self._message_format)
+        finally:
+            cursor.endEditBlock()
+            self.log_text.setUpdatesEnabled(updates_enabled)
+
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def set_max_lines(self, max_lines: int) -> None:
+        """Set how many log lines are kept.
+
+        Args:
+            max_lines: Number of lines to keep, 0 for no limit
+        """
+        self.log_text.document().setMaximumBlockCount(max_lines)
 
     def copy_log(self) -> None:
-        """Copy log content to clipboard."""
+        """Copy log content to clipboard.
+
+        Only the retained lines (see ``set_max_lines``) are copied.
+        """
+        self._flush()
         self.log_text.selectAll()
         self.log_text.copy()
 
     def clear_log(self) -> None:
         """Clear all log content."""
+        self._pending.clear()
+        self._flush_timer.stop()
         self.log_text.clear()
 
     def get_text(self) -> str:
@@ -395,4 +699,5 @@ class LogWidget(QWidget):
         Returns:
             Log content as plain text
         """
+        self._flush()
         return self.log_text.toPlainText()
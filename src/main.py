@@ -6,22 +6,23 @@ It initializes the GUI application and starts the main event loop.
 
 import sys
 import os
+import multiprocessing
 
-# 确保 src 目录在 sys.path 中（打包后需要）
+# 确保 src 目录在 sys.path 中（打包后需要）；重复的条目无害，不必先查找
 if getattr(sys, 'frozen', False):
     # 打包后的环境
-    _src_path = os.path.join(sys._MEIPASS, 'src')
+    sys.path.insert(0, os.path.join(sys._MEIPASS, 'src'))
 else:
     # 开发环境
-    _src_path = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-if _src_path not in sys.path:
-    sys.path.insert(0, _src_path)
-
-from PyQt5.QtWidgets import QApplication
+from PyQt5.QtWidgets import QApplication, QSplashScreen
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QPixmap
+
 
-from gui.main_window import MainWindow
+# Application and organization name
+APP_NAME = "DOCX 批量更新器"
 
 
 def main() -> int:
@@ -36,18 +37,32 @@ def main() -> int:
 
     # Create application instance
     app = QApplication(sys.argv)
-    app.setApplicationName("DOCX 批量更新器")
-    app.setOrganizationName("DOCX 批量更新器")
+    app.setApplicationName(APP_NAME)
+    app.setOrganizationName(APP_NAME)
+
+    # Show a splash screen while the GUI modules load
+    pixmap = QPixmap(360, 120)
+    pixmap.fill(QColor("white"))
+    splash = QSplashScreen(pixmap)
+    splash.showMessage("正在启动…", Qt.AlignCenter)
+    splash.show()
+    app.processEvents()
+
+    # Imported after the application exists so the splash appears first
+    from gui.main_window import MainWindow
 
     # Create and show main window
     window = MainWindow()
     window.show()
+    splash.finish(window)
 
     # Run application
     return app.exec_()
 
 
 if __name__ == "__main__":
+    # Required for the batch worker processes in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
     sys.exit(main())
 
 # policy-guard test change
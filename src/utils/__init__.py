@@ -1,5 +1,6 @@
-"""Utility module for format preservation."""
+"""Utility modules for format preservation and file copying."""
 
+from .fastcopy import fast_copy
 from .format_preserver import FormatPreserver
 
-__all__ = ['FormatPreserver']
+__all__ = ['FormatPreserver', 'fast_copy']
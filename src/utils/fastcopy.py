@@ -0,0 +1,114 @@
+"""In-kernel file copy used for document backups.
+
+This module copies files with ``copy_file_range(2)`` or ``sendfile(2)``
+where the platform provides them, so the data never passes through a
+user-space buffer, and falls back to ``shutil.copyfile`` elsewhere.
+"""
+
+import errno
+import os
+import shutil
+import sys
+
+
+# Chunk requested per system call; the kernel copies less near EOF
+_CHUNK_SIZE = 1 << 30
+
+# Errors meaning "this method does not work here", as opposed to real I/O
+# failures such as a full disk, which are raised
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EBADF,
+    # sendfile(2) on macOS and the BSDs only writes to sockets
+    errno.ENOTSOCK,
+    getattr(errno, 'EOPNOTSUPP', errno.EINVAL),
+    getattr(errno, 'ENOTSUP', errno.EINVAL),
+}
+
+
+def _copy_file_range_chunk(src_fd: int, dst_fd: int, offset: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, _CHUNK_SIZE, offset, offset)
+
+
+def _sendfile_chunk(src_fd: int, dst_fd: int, offset: int) -> int:
+    return os.sendfile(dst_fd, src_fd, offset, _CHUNK_SIZE)
+
+
+# In-kernel copy primitives, best first: copy_file_range(2), sendfile(2).
+# Only Linux's sendfile(2) accepts a regular file as destination, so it is
+# not used elsewhere, as in shutil
+_KERNEL_COPY_METHODS = [
+    method
+    for name, method, usable in (
+        ('copy_file_range', _copy_file_range_chunk, True),
+        ('sendfile', _sendfile_chunk, sys.platform.startswith('linux')),
+    )
+    if usable and hasattr(os, name)
+]
+
+
+def _copy_in_kernel(src_fd: int, dst_fd: int) -> bool:
+    """Copy file contents between descriptors without a user-space buffer.
+
+    Args:
+        src_fd: Descriptor of the source file
+        dst_fd: Descriptor of the destination file
+
+    Returns:
+        True if the file was copied up to EOF, False if no in-kernel copy
+        works here
+
+    Raises:
+        OSError: If the copy fails for a reason other than lack of support
+    """
+    size = os.fstat(src_fd).st_size
+    for copy_chunk in _KERNEL_COPY_METHODS:
+        offset = 0
+        try:
+            while True:
+                sent = copy_chunk(src_fd, dst_fd, offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+        else:
+            # Some file systems report EOF right away instead of failing;
+            # a copy shorter than the source does not count
+            if offset >= size:
+                return True
+        # Unsupported file system or kernel, try the next method
+        os.ftruncate(dst_fd, 0)
+    return False
+
+
+def fast_copy(src: str, dst: str) -> None:
+    """Copy a file with its metadata, like ``shutil.copy2``.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Raises:
+        OSError: If the file cannot be copied
+    """
+    src_fd = os.open(src, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        dst_fd = os.open(
+            dst,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0),
+            0o666
+        )
+        try:
+            copied = _copy_in_kernel(src_fd, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
@@ -5,7 +5,12 @@ in DOCX documents, ensuring that fonts, colors, sizes, and paragraph styles
 are preserved during batch updates.
 """
 
-from typing import Dict, Any, Optional
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from operator import attrgetter
+from typing import Dict, Any, Callable, List, Optional, Pattern, Sequence, Tuple
 from docx.shared import RGBColor
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
@@ -13,135 +18,214 @@ from docx.table import _Cell, Table
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 
 
-class FormatPreserver:
-    """Utility class to preserve document formatting during text replacement.
+# Paragraph searches remembered by find_text_in_paragraph
+_LOCATE_CACHE_SIZE = 4096
 
-    This class provides methods to capture and restore formatting properties
-    from text runs and table cells, ensuring that formatting is preserved
-    during batch replacement operations.
+
+def _attr_setter(path: str) -> Callable[[Any, Any], None]:
+    """Create a setter for a dotted attribute path.
+
+    Args:
+        path: Attribute path such as ``'color.rgb'``
+
+    Returns:
+        Function setting the attribute of an object to a value
     """
+    owner_path, _, name = path.rpartition('.')
+    if not owner_path:
+        return lambda obj, value: setattr(obj, name, value)
+    get_owner = attrgetter(owner_path)
+    return lambda obj, value: setattr(get_owner(obj), name, value)
 
-    @staticmethod
-    def capture_run_format(run) -> Dict[str, Any]:
-        """Capture formatting properties from a text run.
 
-        Args:
-            run: A python-docx Run object
+def _format_fields(*fields: Tuple[str, str, bool]) -> Tuple[tuple, ...]:
+    """Build a table of formatting properties.
 
-        Returns:
-            Dictionary containing formatting properties
-        """
-        format_data = {}
+    Args:
+        fields: (key, attribute path, keep_false) triples; ``keep_false``
+            marks tri-state properties whose False value is captured, other
+            properties are captured only when set to a truthy value
 
-        # Font properties
-        if run.font.name:
-            format_data['font_name'] = run.font.name
+    Returns:
+        Tuple of (key, getter, setter, keep_false) entries
+    """
+    return tuple(
+        (key, attrgetter(path), _attr_setter(path), keep_false)
+        for key, path, keep_false in fields
+    )
+
+
+# Properties of a run's font, in capture and apply order
+_RUN_FORMAT_FIELDS = _format_fields(
+    ('font_name', 'name', False),
+    ('font_size', 'size', False),
+    ('bold', 'bold', True),
+    ('italic', 'italic', True),
+    ('underline', 'underline', False),
+    ('color_rgb', 'color.rgb', False),
+    ('highlight_color', 'highlight_color', False),
+    ('strike', 'strike', True),
+    ('subscript', 'subscript', True),
+    ('superscript', 'superscript', True),
+)
+
+# Properties of a paragraph, in capture and apply order
+_PARAGRAPH_FORMAT_FIELDS = _format_fields(
+    ('alignment', 'alignment', False),
+    ('left_indent', 'paragraph_format.left_indent', False),
+    ('right_indent', 'paragraph_format.right_indent', False),
+    ('first_line_indent', 'paragraph_format.first_line_indent', False),
+    ('space_before', 'paragraph_format.space_before', False),
+    ('space_after', 'paragraph_format.space_after', False),
+    ('line_spacing', 'paragraph_format.line_spacing', False),
+    ('style', 'style', False),
+)
+
+# Properties of a table cell, in capture and apply order
+_CELL_FORMAT_FIELDS = _format_fields(
+    ('width', 'width', False),
+    ('vertical_alignment', 'vertical_alignment', False),
+)
+
+
+@lru_cache(maxsize=_LOCATE_CACHE_SIZE)
+def _locate_in_runs(run_texts: Tuple[str, ...], search_text: str) -> Optional[tuple]:
+    """Locate the first match of a text in a paragraph's runs.
+
+    Keyed by the run texts themselves, so results are reused whenever the
+    same paragraph content is searched again for the same text, within or
+    across documents, and never go stale.
+
+    Args:
+        run_texts: Texts of the paragraph's runs
+        search_text: Text to search for
+
+    Returns:
+        Tuple of (run_index, start_pos, end_pos) or None if not found
+    """
+    paragraph_text = ''.join(run_texts)
 
-        if run.font.size:
-            format_data['font_size'] = run.font.size
+    # Find position in paragraph text
+    start_pos = paragraph_text.find(search_text)
+    if start_pos == -1:
+        return None
+    end_pos = start_pos + len(search_text)
 
-        if run.font.bold is not None:
-            format_data['bold'] = run.font.bold
+    if not run_texts:
+        return None
+    if not search_text:
+        return (0, 0, 0)
 
-        if run.font.italic is not None:
-            format_data['italic'] = run.font.italic
+    # The match starts in the first run ending after its start
+    run_ends = list(accumulate(len(run_text) for run_text in run_texts))
+    run_idx = bisect_right(run_ends, start_pos)
+    run_start = run_ends[run_idx] - len(run_texts[run_idx])
 
-        if run.font.underline:
-            format_data['underline'] = run.font.underline
+    if end_pos <= run_ends[run_idx]:
+        # Search text is entirely within this run
+        return (run_idx, start_pos - run_start, end_pos - run_start)
 
-        if run.font.color and run.font.color.rgb:
-            format_data['color_rgb'] = run.font.color.rgb
+    # Search text spans multiple runs - more complex case
+    # For simplicity, return the starting run and position
+    return (run_idx, start_pos - run_start, len(run_texts[run_idx]) - (start_pos - run_start))
 
-        if run.font.highlight_color:
-            format_data['highlight_color'] = run.font.highlight_color
 
-        if run.font.strike is not None:
-            format_data['strike'] = run.font.strike
+@lru_cache(maxsize=64)
+def _needles_pattern(needles: Tuple[str, ...]) -> Optional[Tuple[Pattern, Tuple[int, ...]]]:
+    """Compile search texts into one alternation with a group per text.
 
-        if run.font.subscript is not None:
-            format_data['subscript'] = run.font.subscript
+    Longer texts come first so the longest text matching at a position
+    wins; equal texts keep their order, so the first of duplicates wins.
 
-        if run.font.superscript is not None:
-            format_data['superscript'] = run.font.superscript
+    Args:
+        needles: Search texts; empty texts are ignored
 
-        return format_data
+    Returns:
+        Tuple of (pattern, needle index of each group), or None if all
+        texts are empty
+    """
+    order = sorted((i for i, needle in enumerate(needles) if needle), key=lambda i: -len(needles[i]))
+    if not order:
+        return None
+    pattern = re.compile('|'.join(f'({re.escape(needles[i])})' for i in order))
+    return pattern, tuple(order)
 
-    @staticmethod
-    def apply_run_format(run, format_data: Dict[str, Any]) -> None:
-        """Apply formatting properties to a text run.
 
-        Args:
-            run: A python-docx Run object
-            format_data: Dictionary of formatting properties
-        """
-        # Font properties
-        if 'font_name' in format_data:
-            run.font.name = format_data['font_name']
+def _capture_format(obj, fields: Tuple[tuple, ...]) -> Dict[str, Any]:
+    """Capture the properties of a table from an object.
 
-        if 'font_size' in format_data:
-            run.font.size = format_data['font_size']
+    Args:
+        obj: Object holding the properties
+        fields: Table built by ``_format_fields``
 
-        if 'bold' in format_data:
-            run.font.bold = format_data['bold']
+    Returns:
+        Dictionary of the captured properties
+    """
+    format_data = {}
+    for key, get_value, _, keep_false in fields:
+        value = get_value(obj)
+        if (value is not None) if keep_false else value:
+            format_data[key] = value
+    return format_data
 
-        if 'italic' in format_data:
-            run.font.italic = format_data['italic']
 
-        if 'underline' in format_data:
-            run.font.underline = format_data['underline']
+def _apply_format(obj, fields: Tuple[tuple, ...], format_data: Dict[str, Any]) -> None:
+    """Apply the captured properties of a table to an object.
 
-        if 'color_rgb' in format_data:
-            run.font.color.rgb = format_data['color_rgb']
+    Args:
+        obj: Object receiving the properties
+        fields: Table built by ``_format_fields``
+        format_data: Dictionary of captured properties
+    """
+    for key, _, set_value, _ in fields:
+        if key in format_data:
+            set_value(obj, format_data[key])
 
-        if 'highlight_color' in format_data:
-            run.font.highlight_color = format_data['highlight_color']
 
-        if 'strike' in format_data:
-            run.font.strike = format_data['strike']
+class FormatPreserver:
+    """Utility class to preserve document formatting during text replacement.
 
-        if 'subscript' in format_data:
-            run.font.subscript = format_data['subscript']
+    This class provides methods to capture and restore formatting properties
+    from text runs and table cells, ensuring that formatting is preserved
+    during batch replacement operations.
 
-        if 'superscript' in format_data:
-            run.font.superscript = format_data['superscript']
+    The methods keep no per-document state, so they can be used from any
+    worker; documents are processed in parallel by ``BatchProcessor``.
+    """
 
     @staticmethod
-    def capture_paragraph_format(paragraph: Paragraph) -> Dict[str, Any]:
-        """Capture paragraph formatting properties.
+    def capture_run_format(run) -> Dict[str, Any]:
+        """Capture formatting properties from a text run.
 
         Args:
-            paragraph: A python-docx Paragraph object
+            run: A python-docx Run object
 
         Returns:
-            Dictionary containing paragraph formatting properties
+            Dictionary containing formatting properties
         """
-        format_data = {}
-
-        if paragraph.alignment:
-            format_data['alignment'] = paragraph.alignment
+        return _capture_format(run.font, _RUN_FORMAT_FIELDS)
 
-        if paragraph.paragraph_format.left_indent:
-            format_data['left_indent'] = paragraph.paragraph_format.left_indent
-
-        if paragraph.paragraph_format.right_indent:
-            format_data['right_indent'] = paragraph.paragraph_format.right_indent
-
-        if paragraph.paragraph_format.first_line_indent:
-            format_data['first_line_indent'] = paragraph.paragraph_format.first_line_indent
-
-        if paragraph.paragraph_format.space_before:
-            format_data['space_before'] = paragraph.paragraph_format.space_before
+    @staticmethod
+    def apply_run_format(run, format_data: Dict[str, Any]) -> None:
+        """Apply formatting properties to a text run.
 
-        if paragraph.paragraph_format.space_after:
-            format_data['space_after'] = paragraph.paragraph_format.space_after
+        Args:
+            run: A python-docx Run object
+            format_data: Dictionary of formatting properties
+        """
+        _apply_format(run.font, _RUN_FORMAT_FIELDS, format_data)
 
-        if paragraph.paragraph_format.line_spacing:
-            format_data['line_spacing'] = paragraph.paragraph_format.line_spacing
+    @staticmethod
+    def capture_paragraph_format(paragraph: Paragraph) -> Dict[str, Any]:
+        """Capture paragraph formatting properties.
 
-        if paragraph.style:
-            format_data['style'] = paragraph.style
+        Args:
+            paragraph: A python-docx Paragraph object
 
-        return format_data
+        Returns:
+            Dictionary containing paragraph formatting properties
+        """
+        return _capture_format(paragraph, _PARAGRAPH_FORMAT_FIELDS)
 
     @staticmethod
     def apply_paragraph_format(paragraph: Paragraph, format_data: Dict[str, Any]) -> None:
@@ -151,29 +235,7 @@ class FormatPreserver:
             paragraph: A python-docx Paragraph object
             format_data: Dictionary of paragraph formatting properties
         """
-        if 'alignment' in format_data:
-            paragraph.alignment = format_data['alignment']
-
-        if 'left_indent' in format_data:
-            paragraph.paragraph_format.left_indent = format_data['left_indent']
-
-        if 'right_indent' in format_data:
-            paragraph.paragraph_format.right_indent = format_data['right_indent']
-
-        if 'first_line_indent' in format_data:
-            paragraph.paragraph_format.first_line_indent = format_data['first_line_indent']
-
-        if 'space_before' in format_data:
-            paragraph.paragraph_format.space_before = format_data['space_before']
-
-        if 'space_after' in format_data:
-            paragraph.paragraph_format.space_after = format_data['space_after']
-
-        if 'line_spacing' in format_data:
-            paragraph.paragraph_format.line_spacing = format_data['line_spacing']
-
-        if 'style' in format_data:
-            paragraph.style = format_data['style']
+        _apply_format(paragraph, _PARAGRAPH_FORMAT_FIELDS, format_data)
 
     @staticmethod
     def capture_cell_format(cell: _Cell) -> Dict[str, Any]:
@@ -185,13 +247,7 @@ class FormatPreserver:
         Returns:
             Dictionary containing cell formatting properties
         """
-        format_data = {}
-
-        if cell.width:
-            format_data['width'] = cell.width
-
-        if cell.vertical_alignment:
-            format_data['vertical_alignment'] = cell.vertical_alignment
+        format_data = _capture_format(cell, _CELL_FORMAT_FIELDS)
 
         if hasattr(cell, 'shading') and cell.shading and cell.shading.background_color:
             format_data['background_color'] = cell.shading.background_color
@@ -206,53 +262,89 @@ class FormatPreserver:
             cell: A python-docx _Cell object
             format_data: Dictionary of cell formatting properties
         """
-        if 'width' in format_data:
-            cell.width = format_data['width']
-
-        if 'vertical_alignment' in format_data:
-            cell.vertical_alignment = format_data['vertical_alignment']
+        _apply_format(cell, _CELL_FORMAT_FIELDS, format_data)
 
         if 'background_color' in format_data:
             cell.shading.background_color = format_data['background_color']
 
     @staticmethod
-    def find_text_in_paragraph(paragraph: Paragraph, search_text: str) -> Optional[tuple]:
+    def paragraph_run_texts(paragraph: Paragraph) -> Tuple[str, ...]:
+        """Read the texts of a paragraph's runs.
+
+        Callers searching one paragraph for several texts read them once and
+        pass them to the find methods, which otherwise walk the runs again.
+
+        Args:
+            paragraph: A python-docx Paragraph object
+
+        Returns:
+            Tuple of run texts; the paragraph text is their join
+        """
+        return tuple(run.text for run in paragraph.runs)
+
+    @staticmethod
+    def find_text_in_paragraph(
+        paragraph: Paragraph,
+        search_text: str,
+        run_texts: Optional[Tuple[str, ...]] = None
+    ) -> Optional[tuple]:
         """Find text within a paragraph's runs and return run index and position.
 
         Args:
             paragraph: A python-docx Paragraph object
             search_text: Text to search for
+            run_texts: Run texts from ``paragraph_run_texts``, read from the
+                paragraph if not given
 
         Returns:
             Tuple of (run_index, start_pos, end_pos) or None if not found
         """
-        paragraph_text = paragraph.text
+        if run_texts is None:
+            run_texts = FormatPreserver.paragraph_run_texts(paragraph)
+        return _locate_in_runs(run_texts, search_text)
 
-        if search_text not in paragraph_text:
-            return None
-
-        # Find position in paragraph text
-        start_pos = paragraph_text.find(search_text)
-        end_pos = start_pos + len(search_text)
-
-        # Map paragraph position to run and character position within run
-        current_pos = 0
-        for run_idx, run in enumerate(paragraph.runs):
-            run_text = run.text
-            run_end = current_pos + len(run_text)
+    @staticmethod
+    def find_all_rules_in_paragraph(
+        paragraph: Paragraph,
+        needles: Sequence[str],
+        run_texts: Optional[Tuple[str, ...]] = None
+    ) -> List[Tuple[int, int, int, int]]:
+        """Find every match of several search texts in one scan of a paragraph.
 
-            # Check if search text overlaps with this run
-            if start_pos >= current_pos and end_pos <= run_end:
-                # Search text is entirely within this run
-                return (run_idx, start_pos - current_pos, end_pos - current_pos)
-            elif start_pos < run_end and end_pos > run_end:
-                # Search text spans multiple runs - more complex case
-                # For simplicity, return the starting run and position
-                return (run_idx, start_pos - current_pos, len(run_text) - (start_pos - current_pos))
+        Matches do not overlap; at each position the longest matching text
+        wins.
 
-            current_pos = run_end
+        Args:
+            paragraph: A python-docx Paragraph object
+            needles: Search texts, typically the search texts of the rules
+            run_texts: Run texts from ``paragraph_run_texts``, read from the
+                paragraph if not given
 
-        return None
+        Returns:
+            List of (needle_index, run_index, start_pos, end_pos) in text
+            order, with positions relative to the start of the run where the
+            match begins; end_pos exceeds the run length when the match
+            spans several runs
+        """
+        compiled = _needles_pattern(tuple(needles))
+        if run_texts is None:
+            run_texts = FormatPreserver.paragraph_run_texts(paragraph)
+        if compiled is None or not run_texts:
+            return []
+
+        pattern, order = compiled
+        run_ends = list(accumulate(len(run_text) for run_text in run_texts))
+        matches = []
+        # Matches come in text order, so the run holding each match start is
+        # found by moving forward from the previous one
+        run_idx = 0
+        for match in pattern.finditer(''.join(run_texts)):
+            start_pos, end_pos = match.span()
+            while run_ends[run_idx] <= start_pos:
+                run_idx += 1
+            run_start = run_ends[run_idx] - len(run_texts[run_idx])
+            matches.append((order[match.lastindex - 1], run_idx, start_pos - run_start, end_pos - run_start))
+        return matches
 
     @staticmethod
     def split_run_text(run: Run, split_pos: int) -> tuple:
@@ -4,11 +4,15 @@ This module contains tests for the document processing, format preservation,
 and batch processing functionality.
 """
 
+import io
 import unittest
 import os
 import tempfile
 import shutil
+import zipfile
+from functools import lru_cache
 from pathlib import Path
+from unittest import mock
 
 # Add src to path for imports
 import sys
@@ -55,6 +59,19 @@ class TestFormatPreserver(unittest.TestCase):
         self.assertIn('font_size', format_data)
         self.assertIn('color_rgb', format_data)
 
+    def test_captured_run_formats_are_independent(self):
+        """Test that changing a captured format does not affect later captures."""
+        doc = Document()
+        p = doc.add_paragraph()
+        first = p.add_run("First")
+        second = p.add_run("Second")
+        for run in (first, second):
+            run.bold = True
+
+        first_format = self.preserver.capture_run_format(first)
+        first_format['italic'] = True
+        self.assertNotEqual(self.preserver.capture_run_format(second).get('italic'), True)
+
     def test_capture_paragraph_format(self):
         """Test capturing paragraph format."""
         doc = Document()
@@ -67,6 +84,24 @@ class TestFormatPreserver(unittest.TestCase):
         self.assertIn('alignment', format_data)
         self.assertIn('space_after', format_data)
 
+    def test_find_all_rules_in_paragraph(self):
+        """Test finding several search texts in one paragraph scan."""
+        doc = Document()
+        p = doc.add_paragraph()
+        p.add_run("Hello 20")
+        p.add_run("24, Hello")
+
+        matches = self.preserver.find_all_rules_in_paragraph(p, ["Hello", "2024", "Hell", ""])
+
+        self.assertEqual(matches, [(0, 0, 0, 5), (1, 0, 6, 10), (0, 1, 4, 9)])
+        self.assertEqual(self.preserver.find_all_rules_in_paragraph(p, ["missing"]), [])
+
+        run_texts = self.preserver.paragraph_run_texts(p)
+        self.assertEqual(run_texts, ("Hello 20", "24, Hello"))
+        self.assertEqual(self.preserver.find_text_in_paragraph(p, "2024", run_texts), (0, 6, 2))
+        self.assertEqual(self.preserver.find_all_rules_in_paragraph(p, ["Hello"], run_texts),
+                         [(0, 0, 0, 5), (0, 1, 4, 9)])
+
 
 class TestDocxProcessor(unittest.TestCase):
     """Test document processor functionality."""
@@ -202,10 +237,28 @@ class TestBatchProcessor(unittest.TestCase):
 
     def _create_test_document(self, file_path: str, content: str):
         """Create a test DOCX document."""
+        Path(file_path).write_bytes(self._test_document_bytes(content))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _test_document_bytes(content: str) -> bytes:
+        """Build a test DOCX document once per content and return its bytes.
+
+        The package is re-packed without compression, so reading and saving
+        the fixtures costs no zlib work.
+        """
         doc = Document()
         p = doc.add_paragraph(content)
         p = doc.add_paragraph("Additional text 2024")
-        doc.save(file_path)
+        buffer = io.BytesIO()
+        doc.save(buffer)
+
+        stored = io.BytesIO()
+        with zipfile.ZipFile(buffer) as source, \
+                zipfile.ZipFile(stored, "w", zipfile.ZIP_STORED) as target:
+            for name in source.namelist():
+                target.writestr(name, source.read(name))
+        return stored.getvalue()
 
     def test_process_documents(self):
         """Test processing multiple documents."""
@@ -220,6 +273,167 @@ class TestBatchProcessor(unittest.TestCase):
         self.assertEqual(len(results), 5)
         self.assertTrue(all(r.success for r in results))
 
+    def test_process_documents_without_fast_path(self):
+        """Test processing with the full python-docx object model."""
+        batch_processor = BatchProcessor(max_workers=2, use_fast_path=False)
+
+        results = batch_processor.process_documents(
+            self.test_files,
+            [("2024", "2025")],
+            create_backup=False
+        )
+
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual(sum(r.replacements for r in results), 10)
+        doc = Document(self.test_files[0])
+        self.assertEqual(doc.paragraphs[0].text, "Document 0 2025")
+
+    def test_process_documents_with_backup(self):
+        """Test that backups hold the original content, one per file."""
+        backup_dir = os.path.join(self.temp_dir, "backups")
+        os.makedirs(backup_dir)
+        # A second file with the same name must not share a backup
+        other_dir = os.path.join(self.temp_dir, "other")
+        os.makedirs(other_dir)
+        same_name = os.path.join(other_dir, "test_0.docx")
+        self._create_test_document(same_name, "Other 2024")
+
+        results = self.batch_processor.process_documents(
+            self.test_files + [same_name],
+            [("2024", "2025")],
+            create_backup=True,
+            backup_dir=backup_dir
+        )
+
+        self.assertTrue(all(r.success for r in results))
+        backup_paths = [r.backup_path for r in results]
+        self.assertEqual(len(set(backup_paths)), 6)
+        for result in results:
+            backup_doc = Document(result.backup_path)
+            self.assertTrue(backup_doc.paragraphs[0].text.endswith("2024"))
+            self.assertTrue(Document(result.file_path).paragraphs[0].text.endswith("2025"))
+
+    def test_backup_failure_skips_file(self):
+        """Test that files whose backup fails are reported and left untouched."""
+        missing_dir = os.path.join(self.temp_dir, "missing")
+
+        results = self.batch_processor.process_documents(
+            self.test_files,
+            [("2024", "2025")],
+            create_backup=True,
+            backup_dir=missing_dir
+        )
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(not r.success for r in results))
+        self.assertTrue(all(r.message.startswith("Backup failed") for r in results))
+        self.assertEqual(Document(self.test_files[0]).paragraphs[0].text, "Document 0 2024")
+
+    def test_backup_copy_failure_skips_file(self):
+        """Test that a failed backup copy skips only that file and leaves no backup."""
+        import core.batch_processor as batch_module
+        backup_dir = os.path.join(self.temp_dir, "backups")
+        os.makedirs(backup_dir)
+        real_copy = batch_module.fast_copy
+
+        def failing_copy(src, dst):
+            if src == self.test_files[0]:
+                raise OSError("disk full")
+            real_copy(src, dst)
+
+        with mock.patch.object(batch_module, "fast_copy", failing_copy):
+            results = self.batch_processor.process_documents(
+                self.test_files,
+                [("2024", "2025")],
+                create_backup=True,
+                backup_dir=backup_dir
+            )
+
+        by_path = {r.file_path: r for r in results}
+        self.assertEqual(len(results), 5)
+        self.assertEqual(by_path[self.test_files[0]].message, "Backup failed: disk full")
+        self.assertEqual(Document(self.test_files[0]).paragraphs[0].text, "Document 0 2024")
+        self.assertTrue(all(by_path[path].success for path in self.test_files[1:]))
+        self.assertEqual(len(os.listdir(backup_dir)), 4)
+
+    def test_backup_removed_when_load_fails(self):
+        """Test that a file rejected before any change keeps no backup."""
+        backup_dir = os.path.join(self.temp_dir, "backups")
+        os.makedirs(backup_dir)
+        broken_file = os.path.join(self.temp_dir, "broken.docx")
+        with zipfile.ZipFile(broken_file, "w") as package:
+            package.writestr("[Content_Types].xml", "not xml")
+            package.writestr("_rels/.rels", "not xml")
+            package.writestr("word/document.xml", "not xml")
+
+        batch_processor = BatchProcessor(max_workers=2, use_fast_path=False)
+        results = batch_processor.process_documents(
+            [broken_file, self.test_files[0]],
+            [("2024", "2025")],
+            create_backup=True,
+            backup_dir=backup_dir
+        )
+
+        by_path = {r.file_path: r for r in results}
+        self.assertEqual(by_path[broken_file].message, "Failed to load document")
+        self.assertEqual(by_path[broken_file].backup_path, "")
+        self.assertTrue(by_path[self.test_files[0]].success)
+        self.assertEqual(os.listdir(backup_dir), ["test_0_backup.docx"])
+
+    def test_stop_removes_backups_of_skipped_files(self):
+        """Test that stop() leaves backups only for files that were processed."""
+        backup_dir = os.path.join(self.temp_dir, "backups")
+        os.makedirs(backup_dir)
+        batch_processor = BatchProcessor(max_workers=1)
+
+        results = batch_processor.process_documents(
+            self.test_files,
+            [("2024", "2025")],
+            create_backup=True,
+            backup_dir=backup_dir,
+            result_callback=lambda result: batch_processor.stop()
+        )
+
+        self.assertLess(len(results), len(self.test_files))
+        # A file already being processed when stop() is called still
+        # completes; only files left unchanged lose their backup
+        backups = set(os.listdir(backup_dir))
+        for i, test_file in enumerate(self.test_files):
+            modified = Document(test_file).paragraphs[0].text == f"Document {i} 2025"
+            self.assertEqual(f"test_{i}_backup.docx" in backups, modified)
+
+    def test_result_batch_callback(self):
+        """Test that batch callbacks receive every result exactly once."""
+        batches = []
+        progress = []
+
+        results = self.batch_processor.process_documents(
+            self.test_files + [os.path.join(self.temp_dir, "missing.docx")],
+            [("2024", "2025")],
+            create_backup=False,
+            progress_callback=lambda done, total: progress.append((done, total)),
+            result_batch_callback=batches.append
+        )
+
+        delivered = [result for batch in batches for result in batch]
+        self.assertEqual(len(delivered), 6)
+        self.assertEqual(set(map(id, delivered)), set(map(id, results)))
+        self.assertEqual(progress[-1], (5, 5))
+
+    def test_stop_during_processing(self):
+        """Test that stop() ends the batch early without hanging."""
+        batch_processor = BatchProcessor(max_workers=1)
+
+        results = batch_processor.process_documents(
+            self.test_files,
+            [("2024", "2025")],
+            create_backup=False,
+            result_callback=lambda result: batch_processor.stop()
+        )
+
+        self.assertGreaterEqual(len(results), 1)
+        self.assertLess(len(results), len(self.test_files))
+
     def test_validate_files(self):
         """Test file validation."""
         # Add a non-existent file
@@ -268,6 +482,17 @@ class TestBatchProcessor(unittest.TestCase):
         files = BatchProcessor.get_files_from_directory(self.temp_dir, recursive=False)
         self.assertEqual(len(files), 5)  # Only top-level
 
+    def test_get_files_from_directory_skips_directories(self):
+        """Test that directories named like DOCX files are not returned."""
+        os.makedirs(os.path.join(self.temp_dir, "folder.docx"))
+
+        files = BatchProcessor.get_files_from_directory(self.temp_dir, recursive=False)
+        self.assertEqual(len(files), 5)
+        self.assertEqual(files, sorted(files))
+
+        missing_dir = os.path.join(self.temp_dir, "missing")
+        self.assertEqual(BatchProcessor.get_files_from_directory(missing_dir), [])
+
 
 class TestProcessingResult(unittest.TestCase):
     """Test processing result class."""
@@ -299,6 +524,16 @@ class TestProcessingResult(unittest.TestCase):
         self.assertFalse(result_dict['success'])
         self.assertEqual(result_dict['message'], "Error occurred")
 
+    def test_result_basename(self):
+        """Test file name of a processing result."""
+        result = ProcessingResult(
+            file_path=os.path.join("docs", "test.docx"),
+            success=True
+        )
+
+        self.assertEqual(result.basename, "test.docx")
+        self.assertNotIn('basename', result.to_dict())
+
 
 def run_tests():
     """Run all tests."""
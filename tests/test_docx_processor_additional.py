@@ -2,18 +2,21 @@
 补充 DocxProcessor 的边界与异常分支测试，提升覆盖率。
 """
 
+import copy
+import io
 import os
 import sys
 import tempfile
 import shutil
 import unittest
+from unittest import mock
 
 # 添加 src 到路径以便导入
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 try:
     from docx import Document
-    from core.docx_processor import DocxProcessor
+    from core.docx_processor import DocxProcessor, ReplacementSet, _set_run_text
 except ImportError as e:
     print(f"Import error: {e}")
     print("Please install dependencies: pip install -r requirements.txt")
@@ -23,16 +26,30 @@ except ImportError as e:
 class TestDocxProcessorAdditional(unittest.TestCase):
     """DocxProcessor 边界条件与异常分支测试。"""
 
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_file = os.path.join(self.temp_dir, "sample.docx")
-
+    @classmethod
+    def setUpClass(cls):
+        # 样例文档只生成一次，各测试直接写入缓存的字节
         doc = Document()
         doc.add_paragraph("Hello 2024")
         doc.add_paragraph("Another 2024")
         table = doc.add_table(rows=1, cols=1)
         table.rows[0].cells[0].text = "Cell 2024"
-        doc.save(self.test_file)
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        cls.sample_bytes = buffer.getvalue()
+        cls.template_doc = Document(io.BytesIO(cls.sample_bytes))
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.test_file = os.path.join(self.temp_dir, "sample.docx")
+        with open(self.test_file, "wb") as handle:
+            handle.write(self.sample_bytes)
+
+    def _loaded_processor(self):
+        """返回已载入样例文档的处理器；文档深拷贝自缓存，无需重新解析。"""
+        processor = DocxProcessor(self.test_file)
+        processor.doc = copy.deepcopy(self.template_doc)
+        return processor
 
     def tearDown(self):
         if os.path.exists(self.temp_dir):
@@ -50,8 +67,7 @@ class TestDocxProcessorAdditional(unittest.TestCase):
 
     def test_replace_multiple(self):
         """多规则替换应返回累计数量。"""
-        processor = DocxProcessor(self.test_file)
-        processor.load()
+        processor = self._loaded_processor()
 
         count = processor.replace_multiple([
             ("2024", "2025"),
@@ -60,6 +76,89 @@ class TestDocxProcessorAdditional(unittest.TestCase):
 
         self.assertGreaterEqual(count, 4)
 
+    def test_replace_multiple_applies_rules_in_order(self):
+        """多规则应按顺序生效，后续规则可作用于前一条规则的结果。"""
+        processor = self._loaded_processor()
+
+        count = processor.replace_multiple([("2024", "2025"), ("2025", "2026")])
+
+        self.assertEqual(count, 6)
+        self.assertEqual(processor.doc.paragraphs[0].text, "Hello 2026")
+        self.assertEqual(processor.doc.tables[0].rows[0].cells[0].text, "Cell 2026")
+
+    def test_replace_multiple_with_replacement_set(self):
+        """预编译的 ReplacementSet 应可直接传入，空查找文本被忽略。"""
+        rules = ReplacementSet([("", "x"), ("Another", "Other")])
+        self.assertEqual(len(rules), 1)
+        self.assertTrue(rules.matches("Another 2024"))
+        self.assertFalse(rules.matches("Hello 2024"))
+
+        processor = self._loaded_processor()
+        self.assertEqual(processor.replace_multiple(rules), 1)
+        self.assertEqual(processor.doc.paragraphs[1].text, "Other 2024")
+
+    def test_replacement_set_coerce_caches(self):
+        """相同规则列表应复用同一个编译结果，已编译的集合原样返回。"""
+        first = ReplacementSet.coerce([("2024", "2025"), ("Hello", "Hi")])
+        second = ReplacementSet.coerce([["2024", "2025"], ["Hello", "Hi"]])
+        self.assertIs(first, second)
+        self.assertIs(ReplacementSet.coerce(first), first)
+
+    def test_replacement_set_restricted_to(self):
+        """按文本收窄规则时，只保留可能生效（含被前序规则产生）的规则。"""
+        rules = ReplacementSet([("foo", "bar"), ("missing", "x"), ("bar!", "ok")])
+        restricted = rules.restricted_to("foo!")
+        self.assertEqual(restricted.rules, (("foo", "bar"), ("bar!", "ok")))
+
+        self.assertEqual(len(rules.restricted_to("nothing here")), 0)
+        self.assertIs(rules.restricted_to("foo missing bar!"), rules)
+
+        deleting = ReplacementSet([("-", ""), ("ab", "x")])
+        self.assertEqual(len(deleting.restricted_to("a-b")), 2)
+
+    def test_replacement_set_stages(self):
+        """互不影响的连续规则应归入同一阶段一次扫描完成，结果与逐条替换一致。"""
+        independent = ReplacementSet([("2024", "2025"), ("Hello", "Hi")])
+        self.assertEqual(
+            [mapping for _, mapping in independent._stages],
+            [{"2024": "2025", "Hello": "Hi"}]
+        )
+
+        # 前序规则产生后序搜索文本、删除文本或搜索文本重叠时需分阶段替换
+        def stages(rules):
+            return [mapping for _, mapping in ReplacementSet(rules)._stages]
+
+        self.assertEqual(stages([("a", "b"), ("b", "c")]), [{"a": "b"}, {"b": "c"}])
+        self.assertEqual(stages([("-", ""), ("ab", "x")]), [{"-": ""}, {"ab": "x"}])
+        self.assertEqual(stages([("ab", "X"), ("bc", "Y")]), [{"ab": "X"}, {"bc": "Y"}])
+        self.assertEqual(stages([("c", " c"), ("c", "")]), [{"c": " c"}, {"c": ""}])
+        self.assertEqual(
+            stages([("a", "1"), ("b", "2"), ("1", "c"), ("d", "")]),
+            [{"a": "1", "b": "2"}, {"1": "c", "d": ""}]
+        )
+
+        processor = self._loaded_processor()
+        paragraph = processor.doc.add_paragraph()
+        paragraph.add_run("Hello 20")
+        paragraph.add_run("24, Hello")
+        self.assertEqual(processor.replace_multiple(independent), 7)
+        self.assertEqual(paragraph.text, "Hi 2025, Hi")
+        self.assertEqual(paragraph.runs[1].text, "")
+
+    def test_set_run_text_matches_run_setter(self):
+        """直接写入文本节点的结果应与 Run.text 赋值生成的 XML 一致。"""
+        doc = Document()
+        paragraph = doc.add_paragraph()
+        for original, text in [("a", "b "), ("x y", ""), ("a\tb", "c"), ("", "d"), ("e", "f\ng")]:
+            expected = paragraph.add_run(original)
+            expected.bold = True
+            actual = paragraph.add_run(original)
+            actual.bold = True
+
+            expected.text = text
+            _set_run_text(actual, text)
+            self.assertEqual(expected._r.xml, actual._r.xml)
+
     def test_replace_multiple_without_load(self):
         """未加载文档时多规则替换应返回 0。"""
         processor = DocxProcessor(self.test_file)
@@ -67,8 +166,7 @@ class TestDocxProcessorAdditional(unittest.TestCase):
 
     def test_replace_text_progress_callback(self):
         """替换时进度回调应按段落与表格数量触发。"""
-        processor = DocxProcessor(self.test_file)
-        processor.load()
+        processor = self._loaded_processor()
         calls = []
 
         def progress_callback(done, total):
@@ -77,6 +175,21 @@ class TestDocxProcessorAdditional(unittest.TestCase):
         processor.replace_text("2024", "2025", progress_callback)
         self.assertEqual(len(calls), 3)
 
+    def test_progress_callback_throttled(self):
+        """大文档的进度回调应约每 1% 触发一次，且总会报告最后一项。"""
+        doc = Document()
+        for i in range(1000):
+            doc.add_paragraph(f"Line {i}")
+        doc.save(self.test_file)
+
+        processor = DocxProcessor(self.test_file)
+        processor.load()
+        calls = []
+        processor.replace_text("Line", "Row", lambda done, total: calls.append((done, total)))
+
+        self.assertEqual(len(calls), 100)
+        self.assertEqual(calls[-1], (1000, 1000))
+
     def test_save_without_doc(self):
         """未加载文档时保存应返回 False。"""
         processor = DocxProcessor(self.test_file)
@@ -84,8 +197,7 @@ class TestDocxProcessorAdditional(unittest.TestCase):
 
     def test_save_failure_invalid_path(self):
         """保存到不存在目录应返回 False。"""
-        processor = DocxProcessor(self.test_file)
-        processor.load()
+        processor = self._loaded_processor()
 
         invalid_path = os.path.join(self.temp_dir, "not_exists", "out.docx")
         self.assertFalse(processor.save(invalid_path))
@@ -128,14 +240,12 @@ class TestDocxProcessorAdditional(unittest.TestCase):
 
     def test_restore_backup_no_backup(self):
         """未创建备份时恢复应返回 False。"""
-        processor = DocxProcessor(self.test_file)
-        processor.load()
+        processor = self._loaded_processor()
         self.assertFalse(processor.restore_backup())
 
     def test_restore_backup_success(self):
         """创建备份后应可恢复。"""
-        processor = DocxProcessor(self.test_file)
-        processor.load()
+        processor = self._loaded_processor()
         backup_path = processor.create_backup()
 
         # 修改原文件内容
@@ -148,8 +258,7 @@ class TestDocxProcessorAdditional(unittest.TestCase):
 
     def test_restore_backup_exception(self):
         """恢复过程中出现异常应返回 False。"""
-        processor = DocxProcessor(self.test_file)
-        processor.load()
+        processor = self._loaded_processor()
 
         backup_path = processor.create_backup()
         processor.backup_path = backup_path
@@ -159,8 +268,7 @@ class TestDocxProcessorAdditional(unittest.TestCase):
 
     def test_create_backup_duplicate(self):
         """重复备份应生成带序号的文件名。"""
-        processor = DocxProcessor(self.test_file)
-        processor.load()
+        processor = self._loaded_processor()
         first_backup = processor.create_backup()
         second_backup = processor.create_backup()
 
@@ -168,6 +276,36 @@ class TestDocxProcessorAdditional(unittest.TestCase):
         self.assertTrue(os.path.exists(second_backup))
         self.assertNotEqual(first_backup, second_backup)
 
+    def test_create_backup_many_duplicates(self):
+        """大量同名备份应得到连续且互不重复的序号。"""
+        processor = DocxProcessor(self.test_file)
+        backups = [processor.create_backup() for _ in range(5)]
+
+        names = [os.path.basename(path) for path in backups]
+        self.assertEqual(names, [
+            "sample_backup.docx",
+            "sample_backup_1.docx",
+            "sample_backup_2.docx",
+            "sample_backup_3.docx",
+            "sample_backup_4.docx",
+        ])
+
+    def test_create_backup_keeps_content_and_mtime(self):
+        """备份内容与修改时间应与原文件一致；无内核拷贝时回退到普通拷贝。"""
+        os.utime(self.test_file, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+        processor = DocxProcessor(self.test_file)
+
+        backups = [processor.create_backup()]
+        with mock.patch("utils.fastcopy._KERNEL_COPY_METHODS", []):
+            backups.append(processor.create_backup())
+
+        with open(self.test_file, "rb") as handle:
+            original = handle.read()
+        for backup in backups:
+            with open(backup, "rb") as handle:
+                self.assertEqual(handle.read(), original)
+            self.assertEqual(os.stat(backup).st_mtime_ns, os.stat(self.test_file).st_mtime_ns)
+
     def test_get_statistics_without_load(self):
         """未加载文档时统计应返回空字典。"""
         processor = DocxProcessor(self.test_file)
@@ -188,6 +326,27 @@ class TestDocxProcessorAdditional(unittest.TestCase):
 
         self.assertEqual(count, 1)
 
+    def test_merged_cell_replaced_once(self):
+        """合并单元格（含其中的嵌套表格）只应处理一次，链式规则不会重复生效。"""
+        merged_file = os.path.join(self.temp_dir, "merged.docx")
+        doc = Document()
+        table = doc.add_table(rows=2, cols=2)
+        merged = table.cell(0, 0).merge(table.cell(1, 1))
+        merged.text = "c"
+        nested_table = merged.add_table(rows=1, cols=1)
+        nested_table.rows[0].cells[0].text = "c"
+        doc.save(merged_file)
+
+        processor = DocxProcessor(merged_file)
+        processor.load()
+        count = processor.replace_multiple([("a", "b"), ("c", "a")])
+        self.assertEqual(count, 2)
+        self.assertTrue(processor.save())
+
+        cell = Document(merged_file).tables[0].cell(0, 0)
+        self.assertEqual(cell.paragraphs[0].text, "a")
+        self.assertEqual(cell.tables[0].cell(0, 0).text, "a")
+
     def test_replace_text_across_runs(self):
         """跨多个 run 的文本应被替换。"""
         run_file = os.path.join(self.temp_dir, "runs.docx")
@@ -204,6 +363,44 @@ class TestDocxProcessorAdditional(unittest.TestCase):
         self.assertEqual(count, 1)
         self.assertEqual(processor.doc.paragraphs[0].text, "Hi")
 
+    def test_replace_within_run_keeps_format(self):
+        """run 内替换应保留该 run 的格式。"""
+        run_file = os.path.join(self.temp_dir, "bold.docx")
+        doc = Document()
+        paragraph = doc.add_paragraph()
+        run = paragraph.add_run("Bold 2024")
+        run.bold = True
+        run.italic = True
+        doc.save(run_file)
+
+        processor = DocxProcessor(run_file)
+        processor.load()
+        self.assertEqual(processor.replace_text("2024", "2025"), 1)
+
+        run = processor.doc.paragraphs[0].runs[0]
+        self.assertEqual(run.text, "Bold 2025")
+        self.assertTrue(run.bold)
+        self.assertTrue(run.italic)
+
+    def test_reset_reuses_processor(self):
+        """reset 后处理器应可用于另一个文档且状态被清空。"""
+        other_file = os.path.join(self.temp_dir, "other.docx")
+        doc = Document()
+        doc.add_paragraph("Other 2024")
+        doc.save(other_file)
+
+        processor = self._loaded_processor()
+        processor.replace_text("2024", "2025")
+        processor.create_backup()
+
+        processor.reset(other_file)
+        self.assertIsNone(processor.doc)
+        self.assertIsNone(processor.backup_path)
+        self.assertEqual(processor.replacement_count, 0)
+
+        self.assertTrue(processor.load())
+        self.assertEqual(processor.doc.paragraphs[0].text, "Other 2024")
+
     def test_close_clears_doc(self):
         """关闭后 doc 应为 None。"""
         processor = DocxProcessor(self.test_file)
@@ -28,6 +28,7 @@ import tempfile
 import shutil
 import unittest
 import zipfile
+from unittest import mock
 
 # 添加 src 到路径以便导入
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -44,50 +45,97 @@ except ImportError as e:
 class TestDocxValidationDecisionTable(unittest.TestCase):
     """基于判定表的 DOCX 校验测试。"""
 
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        # 整个测试类共用一个临时根目录，只在最后删除一次；
+        # Linux 下优先放在内存文件系统 /dev/shm 上
+        shm_dir = "/dev/shm"
+        use_shm = os.path.isdir(shm_dir) and os.access(shm_dir, os.W_OK)
+        cls.root = tempfile.mkdtemp(dir=shm_dir if use_shm else None)
 
-    def tearDown(self):
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.root, ignore_errors=True)
 
-    def test_rule_r1_valid_docx(self):
-        """R1: 所有条件为真 -> True。"""
-        file_path = os.path.join(self.temp_dir, "valid.docx")
+    def setUp(self):
+        # 每个测试使用独立子目录，文件互不冲突
+        self.temp_dir = tempfile.mkdtemp(dir=self.root)
+
+    def test_decision_table(self):
+        """逐条验证判定表规则 R1-R5，所有夹具共用一个临时目录。"""
+        with self.subTest(rule="R1"):
+            # 所有条件为真 -> True
+            file_path = os.path.join(self.temp_dir, "valid.docx")
+            doc = Document()
+            doc.add_paragraph("Hello")
+            doc.save(file_path)
+
+            self.assertTrue(DocxProcessor.is_docx_file(file_path))
+
+        with self.subTest(rule="R2"):
+            # 扩展名不正确 -> False
+            file_path = os.path.join(self.temp_dir, "invalid.txt")
+            with open(file_path, "w", encoding="utf-8") as handle:
+                handle.write("not a docx")
+
+            self.assertFalse(DocxProcessor.is_docx_file(file_path))
+
+        with self.subTest(rule="R3"):
+            # 文件不存在 -> False
+            file_path = os.path.join(self.temp_dir, "missing.docx")
+            self.assertFalse(DocxProcessor.is_docx_file(file_path))
+
+        with self.subTest(rule="R4"):
+            # ZIP 不可读 -> False
+            file_path = os.path.join(self.temp_dir, "not_zip.docx")
+            with open(file_path, "wb") as handle:
+                handle.write(b"not a zip file")
+
+            self.assertFalse(DocxProcessor.is_docx_file(file_path))
+
+        with self.subTest(rule="R5"):
+            # ZIP 可读但缺少必需文件 -> False
+            file_path = os.path.join(self.temp_dir, "missing_parts.docx")
+            with zipfile.ZipFile(file_path, "w") as zip_ref:
+                zip_ref.writestr("[Content_Types].xml", "<Types></Types>")
+
+            self.assertFalse(DocxProcessor.is_docx_file(file_path))
+
+        with self.subTest(rule="R5", case="similar_member_names"):
+            # 仅有名称相近的成员（如 x/word/document.xml）时 -> False
+            file_path = os.path.join(self.temp_dir, "similar_names.docx")
+            with zipfile.ZipFile(file_path, "w") as zip_ref:
+                zip_ref.writestr("[Content_Types].xml", "<Types></Types>")
+                zip_ref.writestr("_rels/.rels", "<Relationships/>")
+                zip_ref.writestr("x/word/document.xml", "<document/>")
+                zip_ref.comment = b"word/document.xml"
+
+            self.assertFalse(DocxProcessor.is_docx_file(file_path))
+
+    def test_cached_result_invalidated_on_change(self):
+        """文件内容变化后应重新校验，而不是沿用缓存结果。"""
+        file_path = os.path.join(self.temp_dir, "changed.docx")
         doc = Document()
         doc.add_paragraph("Hello")
         doc.save(file_path)
-
         self.assertTrue(DocxProcessor.is_docx_file(file_path))
 
-    def test_rule_r2_wrong_extension(self):
-        """R2: 扩展名不正确 -> False。"""
-        file_path = os.path.join(self.temp_dir, "invalid.txt")
-        with open(file_path, "w", encoding="utf-8") as handle:
-            handle.write("not a docx")
-
-        self.assertFalse(DocxProcessor.is_docx_file(file_path))
-
-    def test_rule_r3_missing_file(self):
-        """R3: 文件不存在 -> False。"""
-        file_path = os.path.join(self.temp_dir, "missing.docx")
-        self.assertFalse(DocxProcessor.is_docx_file(file_path))
-
-    def test_rule_r4_not_a_zip(self):
-        """R4: ZIP 不可读 -> False。"""
-        file_path = os.path.join(self.temp_dir, "not_zip.docx")
         with open(file_path, "wb") as handle:
             handle.write(b"not a zip file")
 
         self.assertFalse(DocxProcessor.is_docx_file(file_path))
 
-    def test_rule_r5_missing_required_files(self):
-        """R5: ZIP 可读但缺少必需文件 -> False。"""
-        file_path = os.path.join(self.temp_dir, "missing_parts.docx")
-        with zipfile.ZipFile(file_path, "w") as zip_ref:
-            zip_ref.writestr("[Content_Types].xml", "<Types></Types>")
+    def test_read_error_not_cached(self):
+        """读取文件时的临时错误（如权限问题）不应被缓存为无效结果。"""
+        file_path = os.path.join(self.temp_dir, "locked.docx")
+        doc = Document()
+        doc.add_paragraph("Hello")
+        doc.save(file_path)
 
-        self.assertFalse(DocxProcessor.is_docx_file(file_path))
+        with mock.patch("builtins.open", side_effect=PermissionError("locked")):
+            self.assertFalse(DocxProcessor.is_docx_file(file_path))
+
+        self.assertTrue(DocxProcessor.is_docx_file(file_path))
 
 
 if __name__ == "__main__":
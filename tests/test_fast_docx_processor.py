@@ -0,0 +1,248 @@
+"""
+FastDocxProcessor（直接读写 ZIP 包中的 XML 部件）的测试。
+"""
+
+import os
+import sys
+import tempfile
+import shutil
+import unittest
+import zipfile
+
+# 添加 src 到路径以便导入
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from docx import Document
+    from core.docx_processor import DocxProcessor, FastDocxProcessor, _raw_part_text
+except ImportError as e:
+    print(f"Import error: {e}")
+    print("Please install dependencies: pip install -r requirements.txt")
+    sys.exit(1)
+
+
+class TestFastDocxProcessor(unittest.TestCase):
+    """FastDocxProcessor 替换与保存测试。"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.test_file = os.path.join(self.temp_dir, "sample.docx")
+
+        doc = Document()
+        doc.sections[0].header.paragraphs[0].text = "Header 2024"
+        doc.sections[0].footer.paragraphs[0].text = "Footer"
+        doc.add_paragraph("Hello 2024")
+        paragraph = doc.add_paragraph()
+        paragraph.add_run("Split 20")
+        paragraph.add_run("24 run")
+        table = doc.add_table(rows=1, cols=1)
+        table.rows[0].cells[0].text = "Cell 2024"
+        doc.save(self.test_file)
+
+    def tearDown(self):
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_load_failure(self):
+        """加载不存在文件应返回 False。"""
+        processor = FastDocxProcessor(os.path.join(self.temp_dir, "missing.docx"))
+        self.assertFalse(processor.load())
+        self.assertIsNone(processor.doc)
+
+    def test_replace_body_tables_and_headers(self):
+        """正文、表格（含跨 run）与页眉中的文本都应被替换。"""
+        processor = FastDocxProcessor(self.test_file)
+        self.assertTrue(processor.load())
+
+        count = processor.replace_text("2024", "2025")
+        self.assertEqual(count, 4)
+        self.assertTrue(processor.save())
+
+        doc = Document(self.test_file)
+        self.assertEqual(doc.paragraphs[0].text, "Hello 2025")
+        self.assertEqual(doc.paragraphs[1].text, "Split 2025 run")
+        self.assertEqual(doc.tables[0].rows[0].cells[0].text, "Cell 2025")
+        self.assertEqual(doc.sections[0].header.paragraphs[0].text, "Header 2025")
+
+    def test_matches_docx_processor_on_body(self):
+        """正文替换结果应与 DocxProcessor 一致。"""
+        fast_output = os.path.join(self.temp_dir, "fast.docx")
+        slow_output = os.path.join(self.temp_dir, "slow.docx")
+
+        fast = FastDocxProcessor(self.test_file)
+        fast.load()
+        fast.replace_multiple([("2024", "2025"), ("Hello", "Hi")])
+        fast.save(fast_output)
+
+        slow = DocxProcessor(self.test_file)
+        slow.load()
+        slow.replace_multiple([("2024", "2025"), ("Hello", "Hi")])
+        slow.save(slow_output)
+
+        fast_doc = Document(fast_output)
+        slow_doc = Document(slow_output)
+        self.assertEqual(
+            [p.text for p in fast_doc.paragraphs],
+            [p.text for p in slow_doc.paragraphs]
+        )
+
+    def test_unchanged_parts_copied_verbatim(self):
+        """未修改的部件应原样保留，只改写发生替换的部件。"""
+        output = os.path.join(self.temp_dir, "out.docx")
+        processor = FastDocxProcessor(self.test_file)
+        processor.load()
+        processor.replace_text("Hello", "Hi")
+        self.assertTrue(processor.save(output))
+
+        with zipfile.ZipFile(self.test_file) as original, zipfile.ZipFile(output) as updated:
+            self.assertEqual(original.namelist(), updated.namelist())
+            for info in original.infolist():
+                if info.filename == "word/document.xml":
+                    self.assertNotEqual(original.read(info), updated.read(info.filename))
+                else:
+                    self.assertEqual(original.read(info), updated.read(info.filename))
+                self.assertEqual(info.compress_type, updated.getinfo(info.filename).compress_type)
+
+    def test_save_without_changes_keeps_file(self):
+        """没有替换时保存到原路径不应改写文件。"""
+        mtime_ns = os.stat(self.test_file).st_mtime_ns
+        processor = FastDocxProcessor(self.test_file)
+        processor.load()
+        self.assertEqual(processor.replace_text("missing", "x"), 0)
+
+        self.assertTrue(processor.save())
+        self.assertEqual(os.stat(self.test_file).st_mtime_ns, mtime_ns)
+
+    def test_parts_without_hits_are_not_parsed(self):
+        """原始 XML 中不含搜索文本的部件不应被解析，也不应被改写。"""
+        processor = FastDocxProcessor(self.test_file)
+        processor.load()
+
+        self.assertEqual(processor.replace_text("Header", "Top"), 1)
+        self.assertNotIn("word/document.xml", processor._parts)
+        self.assertEqual(processor._changed_parts, {"word/header1.xml"})
+
+    def test_unchanged_parts_released_and_reparsed(self):
+        """未修改部件的解析树应被释放，后续替换时重新解析。"""
+        processor = FastDocxProcessor(self.test_file)
+        processor.load()
+
+        # 原始文本跨段落拼接后才出现，需解析后才能确认无匹配
+        self.assertEqual(processor.replace_text("2024Split", "x"), 0)
+        self.assertEqual(processor._parts, {})
+
+        self.assertEqual(processor.replace_text("Hello", "Hi"), 1)
+        self.assertTrue(processor.save())
+        self.assertEqual(Document(self.test_file).paragraphs[0].text, "Hi 2024")
+
+    def test_edits_kept_after_save_and_release(self):
+        """保存后释放的部件再次替换时，应基于已保存的内容而不是原始 XML。"""
+        processor = FastDocxProcessor(self.test_file)
+        processor.load()
+
+        # 跨 run 匹配需解析文档部件
+        self.assertEqual(processor.replace_text("2024", "2025"), 4)
+        self.assertTrue(processor.save())
+        # 无匹配的一轮会释放已解析的部件
+        self.assertEqual(processor.replace_text("zzz", "x"), 0)
+        self.assertEqual(processor.replace_text("Hello", "Hi"), 1)
+        self.assertTrue(processor.save())
+
+        doc = Document(self.test_file)
+        self.assertEqual(doc.paragraphs[0].text, "Hi 2025")
+        self.assertEqual(doc.paragraphs[1].text, "Split 2025 run")
+        self.assertEqual(doc.tables[0].rows[0].cells[0].text, "Cell 2025")
+
+    def test_byte_level_replacement(self):
+        """仅含单节点匹配的部件应直接按字节替换，结果与逐段替换一致。"""
+        processor = FastDocxProcessor(self.test_file)
+        processor.load()
+
+        self.assertEqual(processor.replace_multiple([("Hello", "Hi"), ("Cell", "Box")]), 2)
+        self.assertEqual(processor._parts, {})
+        self.assertTrue(processor.save())
+
+        doc = Document(self.test_file)
+        self.assertEqual(doc.paragraphs[0].text, "Hi 2024")
+        self.assertEqual(doc.paragraphs[1].text, "Split 2024 run")
+        self.assertEqual(doc.tables[0].rows[0].cells[0].text, "Box 2024")
+
+    def test_byte_level_with_horizontally_merged_cell(self):
+        """横向合并单元格只处理一次，可走字节级替换，结果与逐段替换一致。"""
+        merged_file = os.path.join(self.temp_dir, "merged.docx")
+        doc = Document()
+        table = doc.add_table(rows=1, cols=2)
+        table.cell(0, 0).merge(table.cell(0, 1)).text = "c"
+        doc.save(merged_file)
+
+        processor = FastDocxProcessor(merged_file)
+        processor.load()
+        self.assertEqual(processor.replace_multiple([("a", "b"), ("c", "a")]), 1)
+        self.assertEqual(processor._parts, {})
+        self.assertTrue(processor.save())
+        self.assertEqual(Document(merged_file).tables[0].cell(0, 0).text, "a")
+
+    def test_byte_level_falls_back_when_unsafe(self):
+        """替换文本带首尾空白或含 XML 特殊字符时应回退到解析路径。"""
+        processor = FastDocxProcessor(self.test_file)
+        processor.load()
+
+        self.assertEqual(processor.replace_multiple([("Hello", "<Hi> ")]), 1)
+        self.assertIn("word/document.xml", processor._parts)
+        self.assertTrue(processor.save())
+        self.assertEqual(Document(self.test_file).paragraphs[0].text, "<Hi>  2024")
+
+    def test_raw_part_text(self):
+        """原始 XML 提取的文本应包含段落文本；含嵌套 run 的部件不做预筛。"""
+        with zipfile.ZipFile(self.test_file) as package:
+            blob = package.read("word/document.xml")
+
+        text = _raw_part_text(blob)
+        self.assertIn("Split 2024 run", text)
+        self.assertIn("Cell 2024", text)
+
+        ns = b'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+        escaped = b'<w:document ' + ns + b'><w:p><w:r><w:t>A&amp;B</w:t><w:tab/><w:t>C</w:t></w:r></w:p></w:document>'
+        self.assertEqual(_raw_part_text(escaped), "A&B\tC")
+
+        hyperlink = b'<w:document ' + ns + b'><w:p><w:hyperlink><w:r><w:t>x</w:t></w:r></w:hyperlink></w:p></w:document>'
+        self.assertIsNone(_raw_part_text(hyperlink))
+
+    def test_save_keeps_existing_tmp_file(self):
+        """保存时的临时文件不应覆盖已有的同名 .tmp 文件，也不应残留。"""
+        tmp_file = self.test_file + ".tmp"
+        with open(tmp_file, "wb") as handle:
+            handle.write(b"keep")
+
+        processor = FastDocxProcessor(self.test_file)
+        processor.load()
+        processor.replace_text("Hello", "Hi")
+        self.assertTrue(processor.save())
+
+        with open(tmp_file, "rb") as handle:
+            self.assertEqual(handle.read(), b"keep")
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["sample.docx", "sample.docx.tmp"])
+
+    @unittest.skipIf(os.name == "nt", "Windows 不支持 POSIX 权限位")
+    def test_save_keeps_file_mode(self):
+        """保存后原文件的权限位应保持不变。"""
+        os.chmod(self.test_file, 0o640)
+        processor = FastDocxProcessor(self.test_file)
+        processor.load()
+        processor.replace_text("Hello", "Hi")
+        self.assertTrue(processor.save())
+
+        self.assertEqual(os.stat(self.test_file).st_mode & 0o777, 0o640)
+
+    def test_save_failure_invalid_path(self):
+        """保存到不存在目录应返回 False。"""
+        processor = FastDocxProcessor(self.test_file)
+        processor.load()
+        processor.replace_text("2024", "2025")
+
+        invalid_path = os.path.join(self.temp_dir, "not_exists", "out.docx")
+        self.assertFalse(processor.save(invalid_path))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
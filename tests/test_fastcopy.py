@@ -0,0 +1,95 @@
+"""
+fast_copy（内核态文件拷贝）的测试。
+"""
+
+import errno
+import os
+import sys
+import tempfile
+import shutil
+import unittest
+from unittest import mock
+
+# 添加 src 到路径以便导入
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from utils import fastcopy
+    from utils.fastcopy import fast_copy
+except ImportError as e:
+    print(f"Import error: {e}")
+    print("Please install dependencies: pip install -r requirements.txt")
+    sys.exit(1)
+
+
+class TestFastCopy(unittest.TestCase):
+    """fast_copy 内容、元数据与回退路径测试。"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.src = os.path.join(self.temp_dir, "src.bin")
+        self.dst = os.path.join(self.temp_dir, "dst.bin")
+        self.data = os.urandom(300_000)
+        with open(self.src, "wb") as handle:
+            handle.write(self.data)
+        os.utime(self.src, ns=(1_500_000_000_000_000_000, 1_500_000_000_000_000_000))
+
+    def tearDown(self):
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def _assert_copied(self):
+        with open(self.dst, "rb") as handle:
+            self.assertEqual(handle.read(), self.data)
+        self.assertEqual(os.stat(self.dst).st_mtime_ns, os.stat(self.src).st_mtime_ns)
+
+    def test_copy_content_and_mtime(self):
+        """拷贝后内容与修改时间应与源文件一致，并覆盖已有目标文件。"""
+        with open(self.dst, "wb") as handle:
+            handle.write(b"x" * 500_000)
+        fast_copy(self.src, self.dst)
+        self._assert_copied()
+
+    def test_unsupported_method_falls_back(self):
+        """内核拷贝不被支持时应回退到下一种方式。"""
+        def unsupported(src_fd, dst_fd, offset):
+            raise OSError(errno.EXDEV, "cross-device")
+
+        with mock.patch.object(fastcopy, "_KERNEL_COPY_METHODS", [unsupported]):
+            fast_copy(self.src, self.dst)
+        self._assert_copied()
+
+    def test_sendfile_to_file_unsupported_falls_back(self):
+        """macOS/BSD 的 sendfile 写普通文件报 ENOTSOCK，应视为不支持并回退。"""
+        def not_socket(src_fd, dst_fd, offset):
+            raise OSError(errno.ENOTSOCK, "not a socket")
+
+        with mock.patch.object(fastcopy, "_KERNEL_COPY_METHODS", [not_socket]):
+            fast_copy(self.src, self.dst)
+        self._assert_copied()
+
+        # sendfile 仅在 Linux 上用于文件拷贝
+        uses_sendfile = fastcopy._sendfile_chunk in fastcopy._KERNEL_COPY_METHODS
+        self.assertEqual(uses_sendfile, sys.platform.startswith("linux") and hasattr(os, "sendfile"))
+
+    def test_premature_eof_falls_back(self):
+        """内核拷贝未复制任何数据就报告 EOF 时，不应得到空备份，应回退。"""
+        def reports_eof(src_fd, dst_fd, offset):
+            return 0
+
+        with mock.patch.object(fastcopy, "_KERNEL_COPY_METHODS", [reports_eof]):
+            fast_copy(self.src, self.dst)
+        self._assert_copied()
+
+    def test_real_errors_are_raised(self):
+        """磁盘已满等真实 I/O 错误不应被吞掉。"""
+        def disk_full(src_fd, dst_fd, offset):
+            raise OSError(errno.ENOSPC, "no space")
+
+        with mock.patch.object(fastcopy, "_KERNEL_COPY_METHODS", [disk_full]):
+            with self.assertRaises(OSError):
+                fast_copy(self.src, self.dst)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)